@@ -18,5 +18,20 @@ DEFAULT_NAMESPACE = "default"
 # How long to wait in seconds for requests to the Kubernetes API Server.
 DEFAULT_TIMEOUT = 120
 
+# How long to wait in seconds to connect to the Kubernetes API Server, so an unreachable
+# API Server fails fast instead of after the DEFAULT_TIMEOUT.
+DEFAULT_CONNECT_TIMEOUT = 10
+
+# How long to wait in seconds for the Kubernetes API Server to send response data.
+DEFAULT_READ_TIMEOUT = DEFAULT_TIMEOUT
+
+# The (connect, read) timeouts for requests to the Kubernetes API Server. Requests sent
+# with _preload_content=False which aren't streamed must set them explicitly.
+DEFAULT_REQUEST_TIMEOUT = (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT)
+
+# The number of worker threads the Kubernetes API client uses to serve requests sent with
+# async_req=True. It bounds how many requests the SDK keeps in flight at once.
+API_CLIENT_POOL_THREADS = 16
+
 # Unknown indicates that the value can't be identified.
 UNKNOWN = "Unknown"
@@ -22,6 +22,7 @@ class KubernetesBackendConfig(BaseModel):
     config_file: str | None = None
     context: str | None = None
     client_configuration: client.Configuration | None = None
+    api_client: client.ApiClient | None = None
 
     class Config:
         arbitrary_types_allowed = True
@@ -11,17 +11,58 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import copy
 import os
+import secrets
+import socket
+import threading
 
-from kubernetes import config
+from kubernetes import client, config
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 
 from kubeflow.common import constants
+from kubeflow.common.types import KubernetesBackendConfig
+
+# The ApiClients created from the in-cluster config or kube-config, keyed on
+# (in-cluster, config file, resolved context name).
+_api_clients: dict[tuple[bool, str | None, str | None], client.ApiClient] = {}
+_api_clients_lock = threading.Lock()
+
+# Retry transient Kubernetes API server errors, e.g. throttling or a restarting control plane.
+# POST and PATCH requests are not replayed, since the first attempt might have been applied.
+_API_CLIENT_RETRIES = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+    raise_on_status=False,
+)
+
+# Keep idle connections to the API server alive, so they are reused across polls instead of
+# being dropped by load balancers and paying for a new TCP and TLS handshake.
+_API_CLIENT_SOCKET_OPTIONS = [
+    *HTTPConnection.default_socket_options,
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    *(
+        (socket.IPPROTO_TCP, getattr(socket, option), value)
+        for option, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 30), ("TCP_KEEPCNT", 3))
+        if hasattr(socket, option)
+    ),
+]
 
 
 def is_running_in_k8s() -> bool:
     return os.path.isdir("/var/run/secrets/kubernetes.io/")
 
 
+def generate_job_name() -> str:
+    """Generate a random 12 character job name, which is a valid RFC 1123 DNS label."""
+    token = secrets.token_hex(6)
+    # The name must start with a letter, so map the first hex digit to one of "a"-"p".
+    return chr(ord("a") + int(token[0], 16)) + token[1:]
+
+
 def get_default_target_namespace(context: str | None = None) -> str:
     if not is_running_in_k8s():
         try:
@@ -39,6 +80,107 @@ def get_default_target_namespace(context: str | None = None) -> str:
         return f.readline()
 
 
+def get_api_client(cfg: KubernetesBackendConfig) -> client.ApiClient:
+    """Get the Kubernetes ApiClient for the given backend config.
+
+    The ApiClient is thread-safe, so clients created from the kube-config or in-cluster config
+    are shared across the process, which lets backends reuse its connection pool. Kube-config
+    clients are shared per config file and resolved context, so switching the current context
+    gives a new client. Use `clear_api_clients()` to drop the shared clients.
+
+    Args:
+        cfg: The Kubernetes backend config. If `api_client` is set, it is returned as is.
+            If `client_configuration` is set, a new ApiClient is created from it.
+
+    Returns:
+        The Kubernetes ApiClient.
+    """
+    if cfg.api_client is not None:
+        return cfg.api_client
+
+    if cfg.client_configuration is not None:
+        return _new_api_client(cfg.client_configuration)
+
+    in_cluster = not cfg.config_file and is_running_in_k8s()
+    context = None if in_cluster else _get_kube_config_context(cfg)
+    key = (in_cluster, cfg.config_file, context)
+    with _api_clients_lock:
+        if key not in _api_clients:
+            # Load kube-config or in-cluster config.
+            if not in_cluster:
+                config.load_kube_config(config_file=cfg.config_file, context=cfg.context)
+            else:
+                try:
+                    config.load_incluster_config()
+                except config.ConfigException:
+                    # Fall back to kube-config, e.g. if the service account isn't mounted.
+                    config.load_kube_config(context=cfg.context)
+            _api_clients[key] = _new_api_client(client.Configuration.get_default_copy())
+        return _api_clients[key]
+
+
+def clear_api_clients() -> None:
+    """Drop the ApiClients shared by `get_api_client()`.
+
+    The next backend reloads its config and creates a new ApiClient. Backends created before
+    keep their client, which closes its thread pool once it's garbage collected.
+    """
+    with _api_clients_lock:
+        _api_clients.clear()
+
+
+def _get_kube_config_context(cfg: KubernetesBackendConfig) -> str | None:
+    """Get the name of the kube-config context which the backend config resolves to."""
+    if cfg.context:
+        return cfg.context
+    try:
+        _, current_context = config.list_kube_config_contexts(config_file=cfg.config_file)
+        return current_context["name"]
+    except Exception:
+        # Loading the kube-config reports the actual error.
+        return None
+
+
+class _ApiClient(client.ApiClient):
+    """ApiClient that sets the default connect and read timeouts for requests without them."""
+
+    def request(self, *args, _preload_content=True, _request_timeout=None, **kwargs):
+        if _request_timeout is None:
+            # Responses which aren't preloaded are usually streamed, e.g. followed Pod logs,
+            # and can be idle for a long time, so only the connection is bounded for them.
+            _request_timeout = (
+                constants.DEFAULT_REQUEST_TIMEOUT
+                if _preload_content
+                else (constants.DEFAULT_CONNECT_TIMEOUT, None)
+            )
+        return super().request(
+            *args,
+            _preload_content=_preload_content,
+            _request_timeout=_request_timeout,
+            **kwargs,
+        )
+
+
+def _new_api_client(configuration: client.Configuration) -> client.ApiClient:
+    configuration = copy.copy(configuration)
+    # Don't override the retry strategy which is set by users.
+    if configuration.retries is None:
+        configuration.retries = _API_CLIENT_RETRIES
+    # Every thread of the pool must be able to keep its connection, otherwise the
+    # connections of concurrent requests are discarded instead of returned to the pool.
+    configuration.connection_pool_maxsize = max(
+        configuration.connection_pool_maxsize or 0, constants.API_CLIENT_POOL_THREADS
+    )
+
+    api_client = _ApiClient(configuration, pool_threads=constants.API_CLIENT_POOL_THREADS)
+    # The connection pools are created on the first request with these arguments.
+    api_client.rest_client.pool_manager.connection_pool_kw.setdefault(
+        "socket_options", _API_CLIENT_SOCKET_OPTIONS
+    )
+
+    return api_client
+
+
 def validate_wait_for_job_status(polling_interval: int, timeout: int) -> None:
     """Validate polling_interval and timeout values used by wait_for_job_status methods.
 
@@ -11,9 +11,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import re
+import socket
+from unittest.mock import Mock
+
+from kubernetes import client
 import pytest
 
 from kubeflow.common import utils
+from kubeflow.common.constants import API_CLIENT_POOL_THREADS
+from kubeflow.common.types import KubernetesBackendConfig
 from kubeflow.trainer.test.common import SUCCESS, TestCase
 
 
@@ -67,3 +74,83 @@ def test_validate_wait_for_job_status(test_case):
             utils.validate_wait_for_job_status(polling_interval, timeout)
     else:
         utils.validate_wait_for_job_status(polling_interval, timeout)
+
+
+def test_get_api_client(monkeypatch):
+    """Test get_api_client shares kube-config clients and returns injected clients as is."""
+    load_kube_config = Mock()
+    monkeypatch.setattr(utils, "_api_clients", {})
+    monkeypatch.setattr(utils, "is_running_in_k8s", lambda: False)
+    monkeypatch.setattr(utils.config, "load_kube_config", load_kube_config)
+
+    current_context = {"name": "default"}
+    monkeypatch.setattr(
+        utils.config, "list_kube_config_contexts", lambda config_file: ([], current_context)
+    )
+
+    api_client = utils.get_api_client(KubernetesBackendConfig())
+    assert utils.get_api_client(KubernetesBackendConfig()) is api_client
+    assert utils.get_api_client(KubernetesBackendConfig(context="default")) is api_client
+    assert utils.get_api_client(KubernetesBackendConfig(context="other")) is not api_client
+    assert load_kube_config.call_count == 2
+
+    # Switching the current context gives a client for the new context.
+    current_context = {"name": "other"}
+    assert utils.get_api_client(KubernetesBackendConfig()) is not api_client
+    assert load_kube_config.call_count == 2
+
+    utils.clear_api_clients()
+    assert utils.get_api_client(KubernetesBackendConfig(context="default")) is not api_client
+    assert load_kube_config.call_count == 3
+    assert api_client.configuration.retries.status_forcelist == [429, 500, 502, 503, 504]
+    assert api_client.configuration.connection_pool_maxsize >= API_CLIENT_POOL_THREADS
+    socket_options = api_client.rest_client.pool_manager.connection_pool_kw["socket_options"]
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+
+    injected_client = client.ApiClient()
+    cfg = KubernetesBackendConfig(api_client=injected_client)
+    assert utils.get_api_client(cfg) is injected_client
+
+
+def test_get_api_client_in_cluster(monkeypatch):
+    """Test get_api_client falls back to kube-config if the in-cluster config can't be loaded."""
+    load_kube_config = Mock()
+    monkeypatch.setattr(utils, "_api_clients", {})
+    monkeypatch.setattr(utils, "is_running_in_k8s", lambda: True)
+    monkeypatch.setattr(utils.config, "load_kube_config", load_kube_config)
+    monkeypatch.setattr(
+        utils.config,
+        "load_incluster_config",
+        Mock(side_effect=utils.config.ConfigException("Service host/port is not set.")),
+    )
+
+    api_client = utils.get_api_client(KubernetesBackendConfig())
+    assert utils.get_api_client(KubernetesBackendConfig()) is api_client
+    load_kube_config.assert_called_once_with(context=None)
+
+
+@pytest.mark.parametrize(
+    "request_kwargs,expected_timeout",
+    [
+        ({}, (10, 120)),
+        ({"_preload_content": False}, (10, None)),
+        ({"_request_timeout": 5}, 5),
+    ],
+)
+def test_api_client_request_timeout(monkeypatch, request_kwargs, expected_timeout):
+    """Test the SDK ApiClient sets the default timeouts for requests without them."""
+    rest_request = Mock()
+    api_client = utils._new_api_client(client.Configuration())
+    monkeypatch.setattr(api_client.rest_client, "request", rest_request)
+
+    api_client.request("GET", "https://localhost/api", **request_kwargs)
+
+    assert rest_request.call_args.kwargs["_request_timeout"] == expected_timeout
+
+
+def test_generate_job_name():
+    """Test generate_job_name returns unique 12 character DNS-1123 labels."""
+    names = {utils.generate_job_name() for _ in range(100)}
+
+    assert len(names) == 100
+    assert all(re.fullmatch(r"[a-p][0-9a-f]{11}", name) for name in names)
@@ -0,0 +1,38 @@
+# Copyright 2025 The Kubeflow Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Shared pytest fixtures for Kubeflow SDK unit tests."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+
+@pytest.fixture
+def kubernetes_apis(monkeypatch):
+    """Stub the Kubernetes client for one test.
+
+    Loading kube-config becomes a no-op, and the CustomObjectsApi and CoreV1Api constructors
+    return fresh Mock instances, exposed as ``custom_api`` and ``core_api``. The patches are
+    undone when the test finishes, so no Mock state is shared between tests.
+    """
+    apis = SimpleNamespace(custom_api=Mock(), core_api=Mock())
+    monkeypatch.setattr("kubernetes.config.load_kube_config", lambda *args, **kwargs: None)
+    monkeypatch.setattr(
+        "kubernetes.client.CustomObjectsApi", lambda *args, **kwargs: apis.custom_api
+    )
+    monkeypatch.setattr("kubernetes.client.CoreV1Api", lambda *args, **kwargs: apis.core_api)
+    return apis
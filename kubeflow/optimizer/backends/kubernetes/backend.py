@@ -16,14 +16,11 @@ from collections.abc import Callable, Iterator
 import copy
 import logging
 import multiprocessing
-import random
-import string
 import time
 from typing import Any
-import uuid
 
 from kubeflow_katib_api import models
-from kubernetes import client, config
+from kubernetes import client
 
 import kubeflow.common.constants as common_constants
 from kubeflow.common.types import KubernetesBackendConfig
@@ -52,20 +49,13 @@ class KubernetesBackend(RuntimeBackend):
         if cfg.namespace is None:
             cfg.namespace = common_utils.get_default_target_namespace(cfg.context)
 
-        # If client configuration is not set, use kube-config to access Kubernetes APIs.
-        if cfg.client_configuration is None:
-            # Load kube-config or in-cluster config.
-            if cfg.config_file or not common_utils.is_running_in_k8s():
-                config.load_kube_config(config_file=cfg.config_file, context=cfg.context)
-            else:
-                config.load_incluster_config()
-
-        k8s_client = client.ApiClient(cfg.client_configuration)
+        k8s_client = common_utils.get_api_client(cfg)
         self.custom_api = client.CustomObjectsApi(k8s_client)
         self.core_api = client.CoreV1Api(k8s_client)
 
         self.namespace = cfg.namespace
-        self.trainer_backend = TrainerBackend(cfg)
+        # The TrainJob APIs share the same ApiClient and its connection pool.
+        self.trainer_backend = TrainerBackend(cfg.model_copy(update={"api_client": k8s_client}))
 
     def optimize(
         self,
@@ -77,7 +67,7 @@ class KubernetesBackend(RuntimeBackend):
         algorithm: BaseAlgorithm | None = None,
     ) -> str:
         # Generate unique name for the OptimizationJob.
-        optimization_job_name = random.choice(string.ascii_lowercase) + uuid.uuid4().hex[:11]
+        optimization_job_name = common_utils.generate_job_name()
 
         # Validate search_space
         if not search_space:
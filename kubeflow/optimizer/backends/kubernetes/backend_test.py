@@ -22,6 +22,7 @@ log retrieval, event filtering, and status waiting.
 from dataclasses import asdict
 import datetime
 import multiprocessing
+from types import SimpleNamespace
 from typing import Any, TypeVar
 from unittest.mock import Mock, patch
 
@@ -45,6 +46,7 @@ from kubeflow.optimizer.types.search_types import (
     Distribution,
     Search,
 )
+from kubeflow.trainer.backends.kubernetes.backend import KubernetesBackend as TrainerBackend
 import kubeflow.trainer.constants.constants as trainer_constants
 from kubeflow.trainer.test.common import (
     DEFAULT_NAMESPACE,
@@ -72,47 +74,49 @@ BASIC_OPTIMIZATION_JOB_NAME = "basic-opt-job"
 BASIC_TRIAL_NAME = "basic-trial"
 BASIC_TRIAL_NAME_2 = "basic-trial-2"
 
+# Search space parameters shared by test cases; optimize() must not mutate them.
+LR_SEARCH = Search.uniform(min=0.001, max=0.1)
+EPOCHS_SEARCH = Search.choice([10, 20, 30])
+
+# Trial func_args that optimize() must leave untouched.
+ORIGINAL_FUNC_ARGS = {"existing_arg": "original_value"}
+
+# Trial template shared by optimize() tests; func_args is reset per test.
+TRIAL_TEMPLATE = TrainJobTemplate(
+    trainer=CustomTrainer(func=lambda: None, func_args={}, num_nodes=1),
+)
+
 # --------------------------
 # Fixtures
 # --------------------------
 
 
 @pytest.fixture
-def optimizer_backend():
+def optimizer_backend(kubernetes_apis, monkeypatch):
     """Provide an optimizer KubernetesBackend with mocked Kubernetes APIs."""
-    with (
-        patch("kubernetes.config.load_kube_config", return_value=None),
-        patch(
-            "kubernetes.client.CustomObjectsApi",
-            return_value=Mock(
-                create_namespaced_custom_object=Mock(side_effect=conditional_error_handler),
-                delete_namespaced_custom_object=Mock(side_effect=conditional_error_handler),
-                get_namespaced_custom_object=Mock(
-                    side_effect=get_namespaced_custom_object_response
-                ),
-                list_namespaced_custom_object=Mock(
-                    side_effect=list_namespaced_custom_object_response
-                ),
-            ),
-        ),
-        patch(
-            "kubernetes.client.CoreV1Api",
-            return_value=Mock(
-                list_namespaced_event=Mock(side_effect=mock_list_namespaced_event),
-            ),
-        ),
-        patch(
-            "kubeflow.trainer.backends.kubernetes.backend.KubernetesBackend.verify_backend",
-            return_value=None,
-        ),
-    ):
-        backend = KubernetesBackend(KubernetesBackendConfig())
-        backend.trainer_backend._get_trainjob_spec = Mock(
-            return_value=Mock(to_dict=Mock(return_value={}))
-        )
-        backend.trainer_backend.get_job = Mock(side_effect=mock_trainer_get_job)
-        backend.trainer_backend._read_pod_logs = Mock(return_value=iter(["test log content"]))
-        yield backend
+    # No test asserts on verify_backend, so a plain no-op replaces it.
+    monkeypatch.setattr(TrainerBackend, "verify_backend", lambda self: None)
+
+    custom_api = kubernetes_apis.custom_api
+    custom_api.create_namespaced_custom_object.side_effect = conditional_error_handler
+    custom_api.delete_namespaced_custom_object.side_effect = conditional_error_handler
+    custom_api.get_namespaced_custom_object.side_effect = get_namespaced_custom_object_response
+    custom_api.list_namespaced_custom_object.side_effect = list_namespaced_custom_object_response
+    core_api = kubernetes_apis.core_api
+    core_api.list_namespaced_event.side_effect = mock_list_namespaced_event
+
+    backend = KubernetesBackend(KubernetesBackendConfig())
+    backend.trainer_backend._get_trainjob_spec = mock_get_trainjob_spec
+    backend.trainer_backend.get_job = Mock(side_effect=mock_trainer_get_job)
+    backend.trainer_backend._read_pod_logs = Mock(return_value=iter(["test log content"]))
+    return backend
+
+
+@pytest.fixture
+def trial_template():
+    """Provide the shared trial template with pristine func_args."""
+    TRIAL_TEMPLATE.trainer.func_args = dict(ORIGINAL_FUNC_ARGS)
+    return TRIAL_TEMPLATE
 
 
 # --------------------------
@@ -242,6 +246,11 @@ def mock_list_namespaced_event(*args, **kwargs):
     return mock_thread
 
 
+def mock_get_trainjob_spec(*args: Any, **kwargs: Any) -> SimpleNamespace:
+    """Return a stand-in TrainJob spec that serializes to an empty dict."""
+    return SimpleNamespace(to_dict=dict)
+
+
 def mock_trainer_get_job(name: str) -> TrainJob:
     """Return a mock TrainJob for the given trial name."""
     return create_mock_trainjob(name)
@@ -411,109 +420,78 @@ def get_optimization_job_data_type(
 
 
 @pytest.mark.parametrize(
-    "test_case",
+    "search_space,expected_names",
     [
-        TestCase(
-            name="single search space parameter",
-            expected_status=SUCCESS,
-            config={
-                "search_space": {
-                    "lr": Search.uniform(min=0.001, max=0.1),
-                },
-            },
+        pytest.param(
+            {"lr": LR_SEARCH},
+            {"lr": LR_SEARCH.name},
+            id="single search space parameter",
         ),
-        TestCase(
-            name="multiple search space parameters",
-            expected_status=SUCCESS,
-            config={
-                "search_space": {
-                    "lr": Search.uniform(min=0.001, max=0.1),
-                    "epochs": Search.choice([10, 20, 30]),
-                },
-            },
-        ),
-        TestCase(
-            name="empty search space raises ValueError",
-            expected_status=FAILED,
-            config={
-                "search_space": {},
-            },
-            expected_error=ValueError,
-        ),
-        TestCase(
-            name="timeout error when creating job",
-            expected_status=FAILED,
-            config={
-                "namespace": TIMEOUT,
-                "search_space": {
-                    "lr": Search.uniform(min=0.001, max=0.1),
-                },
-            },
-            expected_error=TimeoutError,
-        ),
-        TestCase(
-            name="runtime error when creating job",
-            expected_status=FAILED,
-            config={
-                "namespace": RUNTIME,
-                "search_space": {
-                    "lr": Search.uniform(min=0.001, max=0.1),
-                },
-            },
-            expected_error=RuntimeError,
+        pytest.param(
+            {"lr": LR_SEARCH, "epochs": EPOCHS_SEARCH},
+            {"lr": LR_SEARCH.name, "epochs": EPOCHS_SEARCH.name},
+            id="multiple search space parameters",
         ),
     ],
 )
-def test_optimize(optimizer_backend, test_case):
-    """Test KubernetesBackend.optimize with success and error paths."""
-    print("Executing test:", test_case.name)
-
-    search_space = test_case.config["search_space"]
-
-    original_names = {
-        param_name: param_spec.name for param_name, param_spec in search_space.items()
-    }
-
-    trial_template = TrainJobTemplate(
-        trainer=CustomTrainer(
-            func=lambda: None,
-            func_args={"existing_arg": "original_value"},
-            num_nodes=1,
-        ),
+def test_optimize(optimizer_backend, trial_template, search_space, expected_names):
+    """Test KubernetesBackend.optimize does not mutate its inputs."""
+    job_name = optimizer_backend.optimize(
+        trial_template=trial_template,
+        search_space=search_space,
     )
-    original_func_args = dict(trial_template.trainer.func_args)
-
-    try:
-        optimizer_backend.namespace = test_case.config.get("namespace", DEFAULT_NAMESPACE)
-        job_name = optimizer_backend.optimize(
-            trial_template=trial_template,
-            search_space=search_space,
-        )
 
-        assert test_case.expected_status == SUCCESS
-        assert isinstance(job_name, str) and len(job_name) > 0
+    assert isinstance(job_name, str) and len(job_name) > 0
 
-        # Verify search_space param_spec.name values are unchanged.
-        for param_name, param_spec in search_space.items():
-            assert param_spec.name == original_names[param_name]
+    # Verify search_space param_spec.name values are unchanged.
+    assert {k: v.name for k, v in search_space.items()} == expected_names
 
-        # Verify trial_template.trainer.func_args is unchanged.
-        assert trial_template.trainer.func_args == original_func_args
+    # Verify trial_template.trainer.func_args is unchanged.
+    assert trial_template.trainer.func_args == ORIGINAL_FUNC_ARGS
 
-        # Verify the Experiment CR was created with expected payload.
-        optimizer_backend.custom_api.create_namespaced_custom_object.assert_called_once()
-        call_args = optimizer_backend.custom_api.create_namespaced_custom_object.call_args
-        payload = call_args[0][4]
-        assert payload["kind"] == constants.EXPERIMENT_KIND
-        assert len(payload["spec"]["parameters"]) == len(search_space)
-        assert payload["spec"]["objective"]["objectiveMetricName"] == "loss"
-        assert payload["spec"]["algorithm"] is not None
+    # Verify the Experiment CR was created with expected payload.
+    optimizer_backend.custom_api.create_namespaced_custom_object.assert_called_once()
+    call_args = optimizer_backend.custom_api.create_namespaced_custom_object.call_args
+    payload = call_args[0][4]
+    assert payload["kind"] == constants.EXPERIMENT_KIND
+    assert len(payload["spec"]["parameters"]) == len(search_space)
+    assert payload["spec"]["objective"]["objectiveMetricName"] == "loss"
+    assert payload["spec"]["algorithm"] is not None
 
-    except Exception as e:
-        assert test_case.expected_status != SUCCESS
-        assert type(e) is test_case.expected_error
 
-    print("test execution complete")
+@pytest.mark.parametrize(
+    "namespace,search_space,expected_error",
+    [
+        pytest.param(
+            DEFAULT_NAMESPACE,
+            {},
+            ValueError,
+            id="empty search space raises ValueError",
+        ),
+        pytest.param(
+            TIMEOUT,
+            {"lr": LR_SEARCH},
+            TimeoutError,
+            id="timeout error when creating job",
+        ),
+        pytest.param(
+            RUNTIME,
+            {"lr": LR_SEARCH},
+            RuntimeError,
+            id="runtime error when creating job",
+        ),
+    ],
+)
+def test_optimize_failure(
+    optimizer_backend, trial_template, namespace, search_space, expected_error
+):
+    """Test KubernetesBackend.optimize error paths."""
+    optimizer_backend.namespace = namespace
+    with pytest.raises(expected_error):
+        optimizer_backend.optimize(
+            trial_template=trial_template,
+            search_space=search_space,
+        )
 
 
 @pytest.mark.parametrize(
@@ -14,71 +14,73 @@
 
 """Unit tests for SparkClient API."""
 
-from unittest.mock import patch
+from typing import Any
 
 import pytest
 
 from kubeflow.common.types import KubernetesBackendConfig
 from kubeflow.spark.api.spark_client import SparkClient
 from kubeflow.spark.options import Labels
-from kubeflow.spark.test.common import FAILED, SUCCESS, TestCase
 from kubeflow.spark.types.types import (
     FileJob,
     FuncJob,
     SparkJob,
 )
 
+SPARK_BACKEND_CONFIG = KubernetesBackendConfig(namespace="spark")
+
+
+class FakeKubernetesBackend:
+    """In-memory stand-in for the Spark KubernetesBackend used by SparkClient.
+
+    Every constructed backend is recorded in ``instances`` and every submit_job call in
+    ``submit_job_calls``. Set ``submit_job_error`` to make submit_job raise, or
+    ``submit_job_result`` to control the returned SparkJob.
+    """
+
+    instances: list["FakeKubernetesBackend"] = []
+
+    def __init__(self, backend_config: KubernetesBackendConfig):
+        self.backend_config = backend_config
+        self.submit_job_calls: list[dict[str, Any]] = []
+        self.submit_job_error: Exception | None = None
+        self.submit_job_result: SparkJob | None = None
+        FakeKubernetesBackend.instances.append(self)
+
+    def submit_job(self, **kwargs: Any) -> SparkJob | None:
+        self.submit_job_calls.append(kwargs)
+        if self.submit_job_error is not None:
+            raise self.submit_job_error
+        return self.submit_job_result
+
+
+@pytest.fixture(autouse=True)
+def kubernetes_backend(monkeypatch):
+    """Replace the SparkClient KubernetesBackend with FakeKubernetesBackend for every test."""
+    monkeypatch.setattr(FakeKubernetesBackend, "instances", [])
+    monkeypatch.setattr("kubeflow.spark.api.spark_client.KubernetesBackend", FakeKubernetesBackend)
+    return FakeKubernetesBackend
+
+
+def test_default_backend():
+    """Test SparkClient initialization with the default backend."""
+    client = SparkClient()
+
+    assert isinstance(client.backend, FakeKubernetesBackend)
 
-@pytest.mark.parametrize(
-    "test_case",
-    [
-        TestCase(
-            name="default backend initialization",
-            expected_status=SUCCESS,
-            config={},
-        ),
-        TestCase(
-            name="custom namespace initialization",
-            expected_status=SUCCESS,
-            config={"namespace": "spark"},
-        ),
-        TestCase(
-            name="invalid backend config",
-            expected_status=FAILED,
-            config={"backend_config": "invalid"},
-            expected_error=ValueError,
-        ),
-    ],
-)
-def test_create_and_connect(test_case: TestCase):
-    """Test SparkClient initialization scenarios."""
-
-    try:
-        if "namespace" in test_case.config:
-            with patch("kubeflow.spark.api.spark_client.KubernetesBackend") as mock:
-                SparkClient(
-                    backend_config=KubernetesBackendConfig(namespace=test_case.config["namespace"])
-                )
-                mock.assert_called_once()
-        elif "backend_config" in test_case.config:
-            SparkClient(backend_config=test_case.config["backend_config"])
-        else:
-            with patch("kubeflow.spark.api.spark_client.KubernetesBackend"):
-                client = SparkClient()
-                assert client.backend is not None
-
-        # If we reach here but expected an exception, fail
-        assert test_case.expected_status == SUCCESS, (
-            f"Expected exception but none was raised for {test_case.name}"
-        )
-    except Exception as e:
-        # If we got an exception but expected success, fail
-        assert test_case.expected_status == FAILED, f"Unexpected exception in {test_case.name}: {e}"
-        # Validate the exception type if specified
-        if test_case.expected_error:
-            assert isinstance(e, test_case.expected_error), (
-                f"Expected exception type '{test_case.expected_error.__name__}' but got '{type(e).__name__}: {str(e)}'"
-            )
+
+def test_custom_namespace(kubernetes_backend):
+    """Test SparkClient initialization with a custom namespace."""
+    SparkClient(backend_config=SPARK_BACKEND_CONFIG)
+
+    assert len(kubernetes_backend.instances) == 1
+    assert kubernetes_backend.instances[0].backend_config.namespace == "spark"
+
+
+def test_invalid_backend_config_raises():
+    """Test SparkClient initialization with an invalid backend config."""
+    with pytest.raises(ValueError):
+        SparkClient(backend_config="invalid")
 
 
 @pytest.mark.parametrize(
@@ -116,20 +118,15 @@ def test_submit_job_validation(
 ):
     """Test SparkClient submit_job validation."""
 
-    with patch("kubeflow.spark.api.spark_client.KubernetesBackend") as mock_backend:
-        backend = mock_backend.return_value
-
-        if backend_error is not None:
-            backend.submit_job.side_effect = backend_error
+    client = SparkClient()
+    client.backend.submit_job_error = backend_error
 
-        client = SparkClient()
-
-        with pytest.raises(expected_error):
-            client.submit_job(
-                job=job,
-                spark_conf=spark_conf,
-                options=options,
-            )
+    with pytest.raises(expected_error):
+        client.submit_job(
+            job=job,
+            spark_conf=spark_conf,
+            options=options,
+        )
 
 
 @pytest.mark.parametrize(
@@ -152,24 +149,22 @@ def test_submit_job_validation(
 def test_submit_job_success(job, options):
     """Test successful submit_job."""
 
-    with patch("kubeflow.spark.api.spark_client.KubernetesBackend") as mock_backend:
-        backend = mock_backend.return_value
-
-        backend.submit_job.return_value = SparkJob(
-            name="spark-job-123",
-            namespace="default",
-        )
-
-        client = SparkClient()
-
-        name = client.submit_job(job=job, options=options)
-
-        assert name == "spark-job-123"
-
-        backend.submit_job.assert_called_once_with(
-            job=job,
-            num_executors=None,
-            resources_per_executor=None,
-            spark_conf=None,
-            options=options,
-        )
+    client = SparkClient()
+    client.backend.submit_job_result = SparkJob(
+        name="spark-job-123",
+        namespace="default",
+    )
+
+    name = client.submit_job(job=job, options=options)
+
+    assert name == "spark-job-123"
+
+    assert client.backend.submit_job_calls == [
+        {
+            "job": job,
+            "num_executors": None,
+            "resources_per_executor": None,
+            "spark_conf": None,
+            "options": options,
+        }
+    ]
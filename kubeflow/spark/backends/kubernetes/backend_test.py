@@ -50,33 +50,27 @@ from kubeflow.spark.types.types import (
     SparkJobStatus,
 )
 
+# The Spark backend only reads its config, so one default instance is shared by all tests.
+DEFAULT_BACKEND_CONFIG = KubernetesBackendConfig()
+
 # --------------------------
 # Fixtures
 # --------------------------
 
 
 @pytest.fixture
-def kubernetes_backend():
+def kubernetes_backend(kubernetes_apis):
     """Provide KubernetesBackend with mocked K8s APIs."""
-    with (
-        patch("kubernetes.config.load_kube_config", return_value=None),
-        patch(
-            "kubernetes.client.CustomObjectsApi",
-            return_value=Mock(
-                create_namespaced_custom_object=Mock(side_effect=_mock_create),
-                get_namespaced_custom_object=Mock(side_effect=_mock_get),
-                list_namespaced_custom_object=Mock(side_effect=_mock_list),
-                delete_namespaced_custom_object=Mock(side_effect=_mock_delete),
-            ),
-        ),
-        patch(
-            "kubernetes.client.CoreV1Api",
-            return_value=Mock(
-                read_namespaced_pod_log=Mock(side_effect=_mock_read_logs),
-            ),
-        ),
-    ):
-        yield KubernetesBackend(KubernetesBackendConfig())
+    custom_api = kubernetes_apis.custom_api
+    custom_api.create_namespaced_custom_object.side_effect = _mock_create
+    custom_api.get_namespaced_custom_object.side_effect = _mock_get
+    custom_api.list_namespaced_custom_object.side_effect = _mock_list
+    custom_api.delete_namespaced_custom_object.side_effect = _mock_delete
+
+    core_api = kubernetes_apis.core_api
+    core_api.read_namespaced_pod_log.side_effect = _mock_read_logs
+
+    return KubernetesBackend(DEFAULT_BACKEND_CONFIG)
 
 
 # --------------------------
@@ -1518,20 +1512,18 @@ def test_get_job(kubernetes_backend, test_case):
             api_status = test_case.config.get("api_status")
 
             if api_status is not None:
-                with patch.object(
-                    kubernetes_backend.custom_api,
-                    "get_namespaced_custom_object",
-                    side_effect=client.ApiException(status=api_status),
-                ):
-                    with pytest.raises(RuntimeError) as exc_info:
-                        kubernetes_backend.get_job(
-                            test_case.config["job_name"],
-                        )
+                kubernetes_backend.custom_api.get_namespaced_custom_object.side_effect = (
+                    client.ApiException(status=api_status)
+                )
+                with pytest.raises(RuntimeError) as exc_info:
+                    kubernetes_backend.get_job(
+                        test_case.config["job_name"],
+                    )
 
-                    if api_status == 404:
-                        assert "Spark job not found" in str(exc_info.value)
-                    else:
-                        assert "Failed to get Spark job" in str(exc_info.value)
+                if api_status == 404:
+                    assert "Spark job not found" in str(exc_info.value)
+                else:
+                    assert "Failed to get Spark job" in str(exc_info.value)
 
             else:
                 kubernetes_backend.get_job(
@@ -14,6 +14,7 @@
 
 from collections.abc import Callable, Iterator
 import logging
+from typing import Any
 
 from kubeflow.common.types import KubernetesBackendConfig
 import kubeflow.common.utils as common_utils
@@ -186,6 +187,42 @@ class TrainerClient:
             options=options,
         )
 
+    def train_many(self, train_jobs: list[dict[str, Any]]) -> list[str | Exception]:
+        """Create and submit multiple TrainJobs, e.g. for hyperparameter sweeps.
+
+        The Kubernetes backend sends the create requests concurrently. A TrainJob which fails
+        to be created doesn't stop the creation of the others.
+
+        Args:
+            train_jobs: List of TrainJobs to create. Every item is a dictionary with the `train()`
+                arguments of one TrainJob: runtime, initializer, trainer, and options.
+
+        Returns:
+            The unique name of every created TrainJob, or the error raised when it failed to be
+            created, in the order of `train_jobs`. A TimeoutError means the request didn't
+            complete in time, so that TrainJob may still be created.
+
+        Raises:
+            ValueError: If an item of `train_jobs` contains arguments which `train()` doesn't
+                accept. Errors of the TrainJob creation are returned instead of raised.
+
+        Examples:
+            >>> from kubeflow.trainer import TrainerClient, CustomTrainer
+            >>> def train_fn(lr):
+            ...     print(f"Training with lr={lr}")
+            >>> client = TrainerClient()
+            >>> results = client.train_many(
+            ...     [{"trainer": CustomTrainer(func=train_fn, func_args={"lr": lr})} for lr in [0.1, 0.01]]
+            ... )
+            >>> print(results)
+        """
+        train_args = {"runtime", "initializer", "trainer", "options"}
+        for train_job_args in train_jobs:
+            if unknown_args := train_job_args.keys() - train_args:
+                raise ValueError(f"Invalid train() arguments: {sorted(unknown_args)}")
+
+        return self.backend.train_many(train_jobs=train_jobs)
+
     def list_jobs(self, runtime: types.Runtime | None = None) -> list[types.TrainJob]:
         """List created TrainJobs.
 
@@ -291,7 +328,7 @@ class TrainerClient:
     def wait_for_job_status(
         self,
         name: str,
-        status: set[str] = {constants.TRAINJOB_COMPLETE},
+        status: set[str] | None = None,
         timeout: int = 600,
         polling_interval: int = 2,
         callbacks: list[Callable[[types.TrainJob], None]] | None = None,
@@ -70,3 +70,18 @@ def test_backend_selection(test_case):
         client = TrainerClient(backend_config=test_case["backend_config"])
         backend_name = client.backend.__class__.__name__
         assert backend_name == test_case["expected_backend"]
+
+
+def test_train_many():
+    """Test TrainerClient.train_many returns the name or the error of every TrainJob."""
+    client = TrainerClient(backend_config=LocalProcessBackendConfig())
+    error = RuntimeError("Failed to create TrainJob")
+    client.backend.train = Mock(side_effect=["job-1", error])
+
+    results = client.train_many([{"runtime": "torch-distributed"}, {"options": []}])
+
+    assert results == ["job-1", error]
+    assert client.backend.train.call_count == 2
+
+    with pytest.raises(ValueError):
+        client.train_many([{"name": "job-1"}])
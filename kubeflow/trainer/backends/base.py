@@ -14,6 +14,7 @@
 
 import abc
 from collections.abc import Callable, Iterator
+from typing import Any
 
 from kubeflow.trainer.constants import constants
 from kubeflow.trainer.types import types
@@ -50,6 +51,19 @@ class RuntimeBackend(abc.ABC):
     ) -> str:
         raise NotImplementedError()
 
+    def train_many(self, train_jobs: list[dict[str, Any]]) -> list[str | Exception]:
+        """Create multiple TrainJobs one after another.
+
+        Backends which can create TrainJobs concurrently override this method.
+        """
+        results: list[str | Exception] = []
+        for train_job_args in train_jobs:
+            try:
+                results.append(self.train(**train_job_args))
+            except Exception as e:
+                results.append(e)
+        return results
+
     @abc.abstractmethod
     def list_jobs(self, runtime: types.Runtime | None = None) -> list[types.TrainJob]:
         raise NotImplementedError()
@@ -75,7 +89,7 @@ class RuntimeBackend(abc.ABC):
     def wait_for_job_status(
         self,
         name: str,
-        status: set[str] = {constants.TRAINJOB_COMPLETE},
+        status: set[str] | None = None,
         timeout: int = 600,
         polling_interval: int = 2,
         callbacks: list[Callable[[types.TrainJob], None]] | None = None,
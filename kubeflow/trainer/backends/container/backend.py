@@ -42,11 +42,9 @@ import concurrent.futures
 from datetime import datetime
 import logging
 import os
-import random
 import shutil
-import string
-import uuid
 
+import kubeflow.common.utils as common_utils
 from kubeflow.trainer.backends.base import RuntimeBackend
 from kubeflow.trainer.backends.container import utils as container_utils
 from kubeflow.trainer.backends.container.adapters.base import (
@@ -282,10 +280,7 @@ class ContainerBackend(RuntimeBackend):
             raise ValueError(f"{self.__class__.__name__} supports only CustomTrainer in v1")
 
         # Generate train job name if not provided via options
-        trainjob_name = name or (
-            random.choice(string.ascii_lowercase)
-            + uuid.uuid4().hex[: constants.JOB_NAME_UUID_LENGTH]
-        )
+        trainjob_name = name or common_utils.generate_job_name()
 
         logger.debug(f"Starting training job: {trainjob_name}")
         try:
@@ -842,11 +837,14 @@ class ContainerBackend(RuntimeBackend):
     def wait_for_job_status(
         self,
         name: str,
-        status: set[str] = {constants.TRAINJOB_COMPLETE},
+        status: set[str] | None = None,
         timeout: int = 600,
         polling_interval: int = 2,
         callbacks: list[Callable[[types.TrainJob], None]] | None = None,
     ) -> types.TrainJob:
+        if status is None:
+            status = {constants.TRAINJOB_COMPLETE}
+
         import time
 
         end = time.time() + timeout
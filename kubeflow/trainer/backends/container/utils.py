@@ -104,7 +104,7 @@ def build_pip_install_cmd(trainer: types.CustomTrainer) -> str:
     if not pkgs:
         return ""
 
-    index_urls = trainer.pip_index_urls or list(constants.DEFAULT_PIP_INDEX_URLS)
+    index_urls = trainer.pip_index_urls or list(constants.get_default_pip_index_urls())
     main_idx = shlex.quote(index_urls[0])
     extras = " ".join(f"--extra-index-url {shlex.quote(u)}" for u in index_urls[1:])
     quoted = " ".join(shlex.quote(p) for p in pkgs)
@@ -14,18 +14,16 @@
 
 from collections.abc import Callable, Iterator
 import copy
+import json
 import logging
 import multiprocessing
 import os
-import random
 import re
-import string
 import time
 from typing import Any
-import uuid
 
 from kubeflow_trainer_api import models
-from kubernetes import client, config, watch
+from kubernetes import client, watch
 
 import kubeflow.common.constants as common_constants
 from kubeflow.common.types import KubernetesBackendConfig
@@ -37,26 +35,44 @@ from kubeflow.trainer.types import types
 
 logger = logging.getLogger(__name__)
 
+# The required runtime trainer type and the Trainer CR builder for every supported trainer.
+_TRAINER_BUILDERS: dict[
+    type,
+    tuple[types.TrainerType, Callable[..., models.TrainerV1alpha1Trainer]],
+] = {
+    types.CustomTrainer: (
+        types.TrainerType.CUSTOM_TRAINER,
+        lambda runtime, trainer, _: utils.get_trainer_cr_from_custom_trainer(runtime, trainer),
+    ),
+    types.CustomTrainerContainer: (
+        types.TrainerType.CUSTOM_TRAINER,
+        lambda runtime, trainer, _: utils.get_trainer_cr_from_custom_trainer(runtime, trainer),
+    ),
+    types.BuiltinTrainer: (
+        types.TrainerType.BUILTIN_TRAINER,
+        lambda runtime, trainer, initializer: utils.get_trainer_cr_from_builtin_trainer(
+            runtime, trainer, initializer
+        ),
+    ),
+}
+
 
 class KubernetesBackend(RuntimeBackend):
     def __init__(self, cfg: KubernetesBackendConfig):
         if cfg.namespace is None:
             cfg.namespace = common_utils.get_default_target_namespace(cfg.context)
 
-        # If client configuration is not set, use kube-config to access Kubernetes APIs.
-        if cfg.client_configuration is None:
-            # Load kube-config or in-cluster config.
-            if cfg.config_file or not common_utils.is_running_in_k8s():
-                config.load_kube_config(config_file=cfg.config_file, context=cfg.context)
-            else:
-                config.load_incluster_config()
-
-        k8s_client = client.ApiClient(cfg.client_configuration)
+        k8s_client = common_utils.get_api_client(cfg)
         self.custom_api = client.CustomObjectsApi(k8s_client)
         self.core_api = client.CoreV1Api(k8s_client)
 
         self.namespace = cfg.namespace
 
+        # Runtimes rarely change, so get_runtime results are cached for a short time.
+        # The cache maps (namespace, runtime name) to (fetch time, Runtime).
+        self._runtime_cache: dict[tuple[str, str], tuple[float, types.Runtime]] = {}
+        self._runtime_cache_ttl = 30.0
+
         # Perform control-plane version metadata verification.
         self.verify_backend()
 
@@ -182,6 +198,34 @@ class KubernetesBackend(RuntimeBackend):
 
     def get_runtime(self, name: str) -> types.Runtime:
         """Prefer namespaced runtime, fall back to cluster-scoped only if it does not exist"""
+        key = (self.namespace, name)
+        entry = self._runtime_cache.get(key)
+        if entry and time.monotonic() - entry[0] < self._runtime_cache_ttl:
+            return entry[1]
+
+        try:
+            runtime = self.__fetch_runtime(name)
+        except Exception:
+            self._runtime_cache.pop(key, None)
+            raise
+
+        self._runtime_cache[key] = (time.monotonic(), runtime)
+        return runtime
+
+    def invalidate_runtime_cache(self, name: str | None = None):
+        """Drop cached runtimes, e.g. after a TrainingRuntime was changed.
+
+        Args:
+            name: Name of the runtime to drop. If not set, all cached runtimes are dropped.
+        """
+        if name is None:
+            self._runtime_cache.clear()
+            return
+
+        for key in [key for key in self._runtime_cache if key[1] == name]:
+            del self._runtime_cache[key]
+
+    def __fetch_runtime(self, name: str) -> types.Runtime:
         try:
             ns_thread = self.custom_api.get_namespaced_custom_object(
                 constants.GROUP,
@@ -211,6 +255,8 @@ class KubernetesBackend(RuntimeBackend):
             ) from e
 
         try:
+            # Only query cluster scope once the namespaced runtime is known to be missing, so
+            # namespace-only RBAC never sees a forbidden ClusterTrainingRuntime request.
             cluster_thread = self.custom_api.get_cluster_custom_object(
                 constants.GROUP,
                 constants.VERSION,
@@ -302,6 +348,99 @@ class KubernetesBackend(RuntimeBackend):
         | None = None,
         options: list | None = None,
     ) -> str:
+        train_job = self._get_train_job(runtime, initializer, trainer, options)
+        train_job_name = train_job.metadata.name
+
+        # Create the TrainJob.
+        try:
+            response = self.custom_api.create_namespaced_custom_object(
+                constants.GROUP,
+                constants.VERSION,
+                self.namespace,
+                constants.TRAINJOB_PLURAL,
+                train_job.to_dict(),
+                _preload_content=False,
+                _request_timeout=common_constants.DEFAULT_REQUEST_TIMEOUT,
+            )
+            # The created TrainJob is not used, so discard the response without parsing it.
+            response.drain_conn()
+            response.release_conn()
+        except Exception as e:
+            raise self.__get_create_error(train_job_name, e) from e
+
+        logger.debug(
+            f"{constants.TRAINJOB_KIND} {self.namespace}/{train_job_name} has been created"
+        )
+
+        return train_job_name
+
+    def train_many(self, train_jobs: list[dict[str, Any]]) -> list[str | Exception]:
+        """Create multiple TrainJobs concurrently.
+
+        The create requests are sent together, and the API client thread pool bounds how many
+        of them run at once.
+        """
+        results: list[str | Exception] = []
+        threads: list[Any] = []
+        for train_job_args in train_jobs:
+            try:
+                train_job = self._get_train_job(**train_job_args)
+                results.append(train_job.metadata.name)
+                threads.append(
+                    self.custom_api.create_namespaced_custom_object(
+                        constants.GROUP,
+                        constants.VERSION,
+                        self.namespace,
+                        constants.TRAINJOB_PLURAL,
+                        train_job.to_dict(),
+                        async_req=True,
+                        _request_timeout=common_constants.DEFAULT_REQUEST_TIMEOUT,
+                    )
+                )
+            except Exception as e:
+                results.append(e)
+                threads.append(None)
+
+        # All requests share a single deadline, so a stalled batch doesn't wait per TrainJob.
+        deadline = time.monotonic() + common_constants.DEFAULT_TIMEOUT
+        for i, thread in enumerate(threads):
+            if thread is None:
+                continue
+            train_job_name = results[i]
+            try:
+                # The response is read on the pool thread, which also releases the connection of
+                # a request that completes after the deadline.
+                thread.get(max(deadline - time.monotonic(), 0))
+            except multiprocessing.TimeoutError as e:
+                results[i] = TimeoutError(
+                    f"Timeout to create {constants.TRAINJOB_KIND}: {self.namespace}/"
+                    f"{train_job_name}. The request is still running, so it may still be created"
+                )
+                results[i].__cause__ = e
+                continue
+            except Exception as e:
+                error = self.__get_create_error(train_job_name, e)
+                error.__cause__ = e
+                results[i] = error
+                continue
+
+            logger.debug(
+                f"{constants.TRAINJOB_KIND} {self.namespace}/{train_job_name} has been created"
+            )
+
+        return results
+
+    def _get_train_job(
+        self,
+        runtime: str | types.Runtime | None = None,
+        initializer: types.Initializer | None = None,
+        trainer: types.CustomTrainer
+        | types.CustomTrainerContainer
+        | types.BuiltinTrainer
+        | None = None,
+        options: list | None = None,
+    ) -> models.TrainerV1alpha1TrainJob:
+        """Get the TrainJob object to create from the given parameters."""
         # Process options to extract configuration
         job_spec = {}
         labels = None
@@ -327,10 +466,7 @@ class KubernetesBackend(RuntimeBackend):
             active_deadline_seconds = spec_section.get("activeDeadlineSeconds")
 
         # Generate unique name for the TrainJob if not provided
-        train_job_name = name or (
-            random.choice(string.ascii_lowercase)
-            + uuid.uuid4().hex[: constants.JOB_NAME_UUID_LENGTH]
-        )
+        train_job_name = name or common_utils.generate_job_name()
 
         # Build the TrainJob spec using the common _get_trainjob_spec method
         trainjob_spec = self._get_trainjob_spec(
@@ -343,7 +479,7 @@ class KubernetesBackend(RuntimeBackend):
         )
 
         # Build the TrainJob.
-        train_job = models.TrainerV1alpha1TrainJob(
+        return models.TrainerV1alpha1TrainJob(
             apiVersion=constants.API_VERSION,
             kind=constants.TRAINJOB_KIND,
             metadata=models.IoK8sApimachineryPkgApisMetaV1ObjectMeta(
@@ -352,30 +488,16 @@ class KubernetesBackend(RuntimeBackend):
             spec=trainjob_spec,
         )
 
-        # Create the TrainJob.
-        try:
-            self.custom_api.create_namespaced_custom_object(
-                constants.GROUP,
-                constants.VERSION,
-                self.namespace,
-                constants.TRAINJOB_PLURAL,
-                train_job.to_dict(),
-            )
-        except multiprocessing.TimeoutError as e:
-            raise TimeoutError(
+    def __get_create_error(self, train_job_name: str, e: Exception) -> Exception:
+        """Get the error to raise when the TrainJob creation fails."""
+        if isinstance(e, multiprocessing.TimeoutError):
+            return TimeoutError(
                 f"Timeout to create {constants.TRAINJOB_KIND}: {self.namespace}/{train_job_name}"
-            ) from e
-        except Exception as e:
-            raise RuntimeError(
-                f"Failed to create {constants.TRAINJOB_KIND}: {self.namespace}/{train_job_name}"
-            ) from e
-
-        logger.debug(
-            f"{constants.TRAINJOB_KIND} {self.namespace}/{train_job_name} has been created"
+            )
+        return RuntimeError(
+            f"Failed to create {constants.TRAINJOB_KIND}: {self.namespace}/{train_job_name}"
         )
 
-        return train_job_name
-
     def list_jobs(self, runtime: types.Runtime | None = None) -> list[types.TrainJob]:
         result = []
         try:
@@ -394,17 +516,45 @@ class KubernetesBackend(RuntimeBackend):
             if not trainjob_list:
                 return result
 
-            for trainjob in trainjob_list.items:
-                # If runtime object is set, we check the TrainJob's runtime reference.
-                if (
+            # If runtime object is set, we check the TrainJob's runtime reference.
+            trainjobs = [
+                trainjob
+                for trainjob in trainjob_list.items
+                if not (
                     runtime is not None
                     and trainjob.spec
                     and trainjob.spec.runtime_ref
                     and trainjob.spec.runtime_ref.name != runtime.name
-                ):
-                    continue
+                )
+            ]
 
-                result.append(self.__get_trainjob_from_cr(trainjob))
+            # List the Pods of all TrainJobs with a single request instead of one per TrainJob.
+            pod_list_thread = self.__list_pods(
+                self.namespace, constants.TRAINJOB_PODS_LABEL_SELECTOR
+            )
+
+            # TrainJobs usually share a few runtimes, so every runtime is fetched only once.
+            runtimes: dict[str, types.Runtime] = {}
+            for trainjob in trainjobs:
+                if trainjob.spec and trainjob.spec.runtime_ref.name not in runtimes:
+                    runtime_name = trainjob.spec.runtime_ref.name
+                    runtimes[runtime_name] = self.get_runtime(runtime_name)
+
+            trainjob_pods: dict[str, list[dict[str, Any]]] = {}
+            for pod in self.__read_pods(pod_list_thread):
+                labels = (pod.get("metadata") or {}).get("labels")
+                if labels:
+                    trainjob_name = labels[constants.JOBSET_NAME_LABEL]
+                    trainjob_pods.setdefault(trainjob_name, []).append(pod)
+
+            for trainjob in trainjobs:
+                result.append(
+                    self.__get_trainjob_from_cr(
+                        trainjob,
+                        runtimes.get(trainjob.spec.runtime_ref.name) if trainjob.spec else None,
+                        trainjob_pods.get(trainjob.metadata.name, []) if trainjob.metadata else [],
+                    )
+                )
 
         except multiprocessing.TimeoutError as e:
             raise TimeoutError(
@@ -419,31 +569,7 @@ class KubernetesBackend(RuntimeBackend):
 
     def get_job(self, name: str) -> types.TrainJob:
         """Get the TrainJob object"""
-
-        try:
-            thread = self.custom_api.get_namespaced_custom_object(
-                constants.GROUP,
-                constants.VERSION,
-                self.namespace,
-                constants.TRAINJOB_PLURAL,
-                name,
-                async_req=True,
-            )
-
-            trainjob = models.TrainerV1alpha1TrainJob.from_dict(
-                thread.get(common_constants.DEFAULT_TIMEOUT)  # type: ignore
-            )
-
-        except multiprocessing.TimeoutError as e:
-            raise TimeoutError(
-                f"Timeout to get {constants.TRAINJOB_KIND}: {self.namespace}/{name}"
-            ) from e
-        except Exception as e:
-            raise RuntimeError(
-                f"Failed to get {constants.TRAINJOB_KIND}: {self.namespace}/{name}"
-            ) from e
-
-        return self.__get_trainjob_from_cr(trainjob)  # type: ignore
+        return self.__get_trainjob_from_cr(self.__get_trainjob_cr(name))
 
     def get_job_logs(
         self,
@@ -452,12 +578,11 @@ class KubernetesBackend(RuntimeBackend):
         step: str = constants.NODE + "-0",
     ) -> Iterator[str]:
         """Get the TrainJob logs"""
+        # Getting the TrainJob CR also fails for a TrainJob that doesn't exist.
+        trainjob_cr = self.__get_trainjob_cr(name)
+
         # Get the TrainJob Pod name.
-        pod_name = None
-        for c in self.get_job(name).steps:
-            if c.status != constants.POD_PENDING and c.name == step:
-                pod_name = c.pod_name
-                break
+        pod_name = self._get_step_pod_name(name, step, trainjob_cr)
         if pod_name is None:
             return
 
@@ -470,19 +595,16 @@ class KubernetesBackend(RuntimeBackend):
     def wait_for_job_status(
         self,
         name: str,
-        status: set[str] = {constants.TRAINJOB_COMPLETE},
+        status: set[str] | None = None,
         timeout: int = 600,
         polling_interval: int = 2,
         callbacks: list[Callable[[types.TrainJob], None]] | None = None,
     ) -> types.TrainJob:
-        job_statuses = {
-            constants.TRAINJOB_CREATED,
-            constants.TRAINJOB_RUNNING,
-            constants.TRAINJOB_COMPLETE,
-            constants.TRAINJOB_FAILED,
-        }
-        if not status.issubset(job_statuses):
-            raise ValueError(f"Expected status {status} must be a subset of {job_statuses}")
+        status = frozenset(status if status is not None else {constants.TRAINJOB_COMPLETE})
+        if not status <= constants.JOB_STATUSES:
+            raise ValueError(
+                f"Expected status {set(status)} must be a subset of {set(constants.JOB_STATUSES)}"
+            )
 
         if polling_interval <= 0:
             raise ValueError(
@@ -494,9 +616,24 @@ class KubernetesBackend(RuntimeBackend):
                 f"Received polling_interval={polling_interval}, timeout={timeout}"
             )
 
+        # The Created and Running statuses are derived from the TrainJob's Pods. When only a
+        # terminal status is expected, the TrainJob CR conditions are enough until it finishes.
+        check_steps = callbacks or not status <= constants.JOB_TERMINAL_STATUSES
+
         for _ in range(round(timeout / polling_interval)):
-            # Check the status after event is generated for the TrainJob's Pods.
-            trainjob = self.get_job(name)
+            trainjob_cr = self.__get_trainjob_cr(name)
+            if not check_steps and not (
+                trainjob_cr.status
+                and any(
+                    c.type in constants.JOB_TERMINAL_STATUSES and c.status == "True"
+                    for c in trainjob_cr.status.conditions or []
+                )
+            ):
+                logger.debug(f"TrainJob {name} has not finished yet")
+                time.sleep(polling_interval)
+                continue
+
+            trainjob = self.__get_trainjob_from_cr(trainjob_cr)
             logger.debug(f"TrainJob {name}, status {trainjob.status}")
 
             # Invoke callbacks if provided
@@ -589,6 +726,34 @@ class KubernetesBackend(RuntimeBackend):
                 f"Timeout getting {constants.TRAINJOB_KIND} events: {self.namespace}/{name}"
             ) from e
 
+    def __get_trainjob_cr(self, name: str) -> models.TrainerV1alpha1TrainJob:
+        """Get the TrainJob CR"""
+
+        try:
+            thread = self.custom_api.get_namespaced_custom_object(
+                constants.GROUP,
+                constants.VERSION,
+                self.namespace,
+                constants.TRAINJOB_PLURAL,
+                name,
+                async_req=True,
+            )
+
+            trainjob = models.TrainerV1alpha1TrainJob.from_dict(
+                thread.get(common_constants.DEFAULT_TIMEOUT)  # type: ignore
+            )
+
+        except multiprocessing.TimeoutError as e:
+            raise TimeoutError(
+                f"Timeout to get {constants.TRAINJOB_KIND}: {self.namespace}/{name}"
+            ) from e
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to get {constants.TRAINJOB_KIND}: {self.namespace}/{name}"
+            ) from e
+
+        return trainjob  # type: ignore
+
     def __get_runtime_from_cr(
         self,
         runtime_cr: models.TrainerV1alpha1ClusterTrainingRuntime
@@ -626,6 +791,57 @@ class KubernetesBackend(RuntimeBackend):
             ),
         )
 
+    def _get_step_pod_name(
+        self, name: str, step: str, trainjob_cr: models.TrainerV1alpha1TrainJob
+    ) -> str | None:
+        """Get the Pod name of the TrainJob step, unless the step is pending or unresolved.
+
+        Only the step's Pods are listed by label selector, which avoids building the whole TrainJob.
+        """
+        label_selector = f"{constants.JOBSET_NAME_LABEL}={name}"
+        role, _, index = step.rpartition("-")
+        if role == constants.NODE and index.isdigit():
+            # The node's rJob and Job index depend on the runtime.
+            if not trainjob_cr.spec:
+                return None
+            rjob_name, job_index = constants.NODE, int(index)
+            # For the MPI use-cases, the launcher container is always node-0, thus the index of
+            # other nodes is shifted by one. See utils.get_trainjob_node_step.
+            runtime = self.get_runtime(trainjob_cr.spec.runtime_ref.name)
+            if runtime.trainer.command[0] == "mpirun":
+                if job_index == 0:
+                    rjob_name = constants.LAUNCHER
+                else:
+                    job_index -= 1
+            label_selector += (
+                f",{constants.JOBSET_RJOB_NAME_LABEL}={rjob_name}"
+                f",{constants.JOB_INDEX_LABEL}={job_index}"
+            )
+        else:
+            label_selector += f",{constants.JOBSET_RJOB_NAME_LABEL}={step}"
+
+        try:
+            pods = self.__read_pods(self.__list_pods(self.namespace, label_selector))
+        except multiprocessing.TimeoutError as e:
+            raise TimeoutError(
+                f"Timeout to list {constants.TRAINJOB_KIND}'s steps: {self.namespace}/{name}"
+            ) from e
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to list {constants.TRAINJOB_KIND}'s steps: {self.namespace}/{name}"
+            ) from e
+
+        # The most recently created Pod represents the step, e.g. after the Pod is restarted.
+        pod = max(pods, key=utils.get_pod_creation_timestamp, default=None)
+        if (
+            pod is None
+            or not pod.get("metadata")
+            or (pod.get("status") or {}).get("phase") == constants.POD_PENDING
+        ):
+            return None
+
+        return pod["metadata"].get("name")
+
     def _read_pod_logs(self, pod_name: str, container_name: str, follow: bool) -> Iterator[str]:
         """Read logs from a pod container."""
         try:
@@ -654,9 +870,34 @@ class KubernetesBackend(RuntimeBackend):
                 f"Failed to read logs for the pod {self.namespace}/{pod_name}"
             ) from e
 
+    def __list_pods(self, namespace: str, label_selector: str) -> Any:
+        """Send the request to list Pods and return its async result."""
+        return self.core_api.list_namespaced_pod(
+            namespace,
+            label_selector=label_selector,
+            async_req=True,
+            _preload_content=False,
+            _request_timeout=common_constants.DEFAULT_REQUEST_TIMEOUT,
+        )
+
+    def __read_pods(self, pod_list_thread: Any) -> list[dict[str, Any]]:
+        """Wait for the Pod listing and return the raw Pods from its response."""
+        response = pod_list_thread.get(common_constants.DEFAULT_TIMEOUT)
+
+        # Pods are kept as plain dicts, so only the fields of the selected step Pods are
+        # deserialized into API objects instead of the whole Pod list.
+        try:
+            pod_list = json.loads(response.data)
+        finally:
+            response.release_conn()
+
+        return (pod_list or {}).get("items") or []
+
     def __get_trainjob_from_cr(
         self,
         trainjob_cr: models.TrainerV1alpha1TrainJob,
+        runtime: types.Runtime | None = None,
+        pods: list[dict[str, Any]] | None = None,
     ) -> types.TrainJob:
         if not (
             trainjob_cr.metadata
@@ -670,7 +911,8 @@ class KubernetesBackend(RuntimeBackend):
         name = trainjob_cr.metadata.name
         namespace = trainjob_cr.metadata.namespace
 
-        runtime = self.get_runtime(trainjob_cr.spec.runtime_ref.name)
+        if runtime is None:
+            runtime = self.get_runtime(trainjob_cr.spec.runtime_ref.name)
 
         # Construct the TrainJob from the CR.
         trainjob = types.TrainJob(
@@ -689,67 +931,56 @@ class KubernetesBackend(RuntimeBackend):
 
         # Add the TrainJob components, e.g. trainer nodes and initializer.
         try:
-            response = self.core_api.list_namespaced_pod(
-                namespace,
-                label_selector=constants.POD_LABEL_SELECTOR.format(trainjob_name=name),
-                async_req=True,
-            ).get(common_constants.DEFAULT_TIMEOUT)
-
-            # Convert Pod to the correct format.
-            # This is required to convert Pod's container resources into API object from str
-            pod_list = models.IoK8sApiCoreV1PodList.from_dict(response.to_dict())
-            if not pod_list:
-                return trainjob
+            if pods is None:
+                pods = self.__read_pods(
+                    self.__list_pods(namespace, utils.get_pod_label_selector(name))
+                )
 
-            sorted_pods = sorted(
-                pod_list.items,
-                key=lambda pod: (
-                    pod.metadata is not None and pod.metadata.creation_timestamp is not None,
-                    pod.metadata.creation_timestamp if pod.metadata else None,
-                ),
-                reverse=True,
-            )
+            sorted_pods = sorted(pods, key=utils.get_pod_creation_timestamp, reverse=True)
             seen_step_keys: set[str] = set()
             for pod in sorted_pods:
                 # Pod must have labels to detect the TrainJob step.
                 # Every Pod always has a single TrainJob step.
-                if not (pod.metadata and pod.metadata.name and pod.metadata.labels and pod.spec):
+                metadata = pod.get("metadata") or {}
+                pod_name = metadata.get("name")
+                labels = metadata.get("labels")
+                if not (pod_name and labels and pod.get("spec")):
                     raise Exception(f"TrainJob Pod is invalid: {pod}")
 
-                role = pod.metadata.labels[constants.JOBSET_RJOB_NAME_LABEL]
+                role = labels[constants.JOBSET_RJOB_NAME_LABEL]
+                if role not in constants.RJOB_NAMES:
+                    continue
+
+                is_node = role in constants.NODE_RJOB_NAMES
                 step_key = role
-                if role in {constants.LAUNCHER, constants.NODE}:
-                    step_key = f"{role}-{pod.metadata.labels[constants.JOB_INDEX_LABEL]}"
+                if is_node:
+                    step_key = f"{role}-{labels[constants.JOB_INDEX_LABEL]}"
 
                 if step_key in seen_step_keys:
                     continue
                 seen_step_keys.add(step_key)
 
+                pod_spec, pod_status = utils.get_pod_step_fields(pod)
+
                 # Get the Initializer step.
-                if role in {
-                    constants.DATASET_INITIALIZER,
-                    constants.MODEL_INITIALIZER,
-                }:
+                if not is_node:
                     trainjob.steps.append(
                         utils.get_trainjob_initializer_step(
-                            pod.metadata.name,
-                            pod.spec,
-                            pod.status,
+                            pod_name,
+                            pod_spec,
+                            pod_status,
                         )
                     )
                 # Get the Node step.
-                elif role in {
-                    constants.LAUNCHER,
-                    constants.NODE,
-                }:
+                else:
                     trainjob.steps.append(
                         utils.get_trainjob_node_step(
-                            pod.metadata.name,
-                            pod.spec,
-                            pod.status,
+                            pod_name,
+                            pod_spec,
+                            pod_status,
                             trainjob.runtime,
                             role,
-                            int(pod.metadata.labels[constants.JOB_INDEX_LABEL]),
+                            int(labels[constants.JOB_INDEX_LABEL]),
                         )
                     )
         except multiprocessing.TimeoutError as e:
@@ -764,12 +995,7 @@ class KubernetesBackend(RuntimeBackend):
         # Update the TrainJob status from its conditions.
         if trainjob_cr.status and trainjob_cr.status.conditions:
             for c in trainjob_cr.status.conditions:
-                if (
-                    c.type == constants.TRAINJOB_COMPLETE
-                    and c.status == "True"
-                    or c.type == constants.TRAINJOB_FAILED
-                    and c.status == "True"
-                ):
+                if c.type in constants.JOB_TERMINAL_STATUSES and c.status == "True":
                     trainjob.status = c.type
         else:
             # The TrainJob running status is defined when all training node (e.g. Pods) are
@@ -808,32 +1034,35 @@ class KubernetesBackend(RuntimeBackend):
         elif isinstance(runtime, str):
             runtime = self.get_runtime(runtime)
 
-        # Build the Trainer.
-        trainer_cr = models.TrainerV1alpha1Trainer()
+        # Build the Trainer. It is only set in the TrainJob when users configure it.
+        trainer_cr: models.TrainerV1alpha1Trainer | None = None
 
         if trainer:
-            # If users choose to use a custom training script.
-            if isinstance(trainer, (types.CustomTrainer, types.CustomTrainerContainer)):
-                if runtime.trainer.trainer_type != types.TrainerType.CUSTOM_TRAINER:
-                    raise ValueError(f"CustomTrainer can't be used with {runtime} runtime")
-                trainer_cr = utils.get_trainer_cr_from_custom_trainer(runtime, trainer)
-
-            # If users choose to use a builtin trainer for post-training.
-            elif isinstance(trainer, types.BuiltinTrainer):
-                if runtime.trainer.trainer_type != types.TrainerType.BUILTIN_TRAINER:
-                    raise ValueError(f"BuiltinTrainer can't be used with {runtime} runtime")
-                trainer_cr = utils.get_trainer_cr_from_builtin_trainer(
-                    runtime, trainer, initializer
-                )
-
-            else:
+            # Users can choose a custom training script or a builtin trainer for post-training.
+            # Subclasses of the supported trainers are found by their base classes.
+            trainer_builder = next(
+                (
+                    _TRAINER_BUILDERS[cls]
+                    for cls in type(trainer).__mro__
+                    if cls in _TRAINER_BUILDERS
+                ),
+                None,
+            )
+            if trainer_builder is None:
                 raise ValueError(
                     f"The trainer type {type(trainer)} is not supported. "
                     "Please use CustomTrainer, CustomTrainerContainer, or BuiltinTrainer."
                 )
 
+            trainer_type, get_trainer_cr = trainer_builder
+            if runtime.trainer.trainer_type != trainer_type:
+                raise ValueError(f"{trainer_type.value} can't be used with {runtime} runtime")
+            trainer_cr = get_trainer_cr(runtime, trainer, initializer)
+
         # Apply trainer overrides if trainer was not provided but overrides exist
         if trainer_overrides:
+            if trainer_cr is None:
+                trainer_cr = models.TrainerV1alpha1Trainer()
             if "command" in trainer_overrides:
                 trainer_cr.command = trainer_overrides["command"]
             if "args" in trainer_overrides:
@@ -848,7 +1077,7 @@ class KubernetesBackend(RuntimeBackend):
 
         trainjob_spec = models.TrainerV1alpha1TrainJobSpec(
             runtimeRef=models.TrainerV1alpha1RuntimeRef(name=runtime.name, kind=runtime.kind.value),
-            trainer=trainer_cr if trainer_cr != models.TrainerV1alpha1Trainer() else None,
+            trainer=trainer_cr,
             runtimePatches=runtime_patch_models,
             activeDeadlineSeconds=active_deadline_seconds,
         )
@@ -21,6 +21,7 @@ It tests KubernetesBackend's behavior across job listing, resource creation etc.
 import copy
 from dataclasses import asdict
 import datetime
+import json
 import logging
 import multiprocessing
 import random
@@ -32,6 +33,7 @@ from kubeflow_trainer_api import models
 from kubernetes import client
 import pytest
 
+import kubeflow.common.constants as common_constants
 from kubeflow.common.types import KubernetesBackendConfig
 from kubeflow.trainer.backends.kubernetes.backend import KubernetesBackend
 import kubeflow.trainer.backends.kubernetes.utils as utils
@@ -74,6 +76,8 @@ FAIL_LOGS = "fail_logs"
 LIST_RUNTIMES = "list_runtimes"
 BASIC_TRAIN_JOB_NAME = "basic-job"
 JOB_WITH_POD_RESTARTS = "job-with-pod-restarts"
+FAILED_JOB = "failed-job"
+MPI_TRAIN_JOB_NAME = "mpi-job"
 TRAIN_JOBS = "trainjobs"
 TRAIN_JOB_WITH_BUILT_IN_TRAINER = "train-job-with-built-in-trainer"
 TRAIN_JOB_WITH_CUSTOM_TRAINER = "train-job-with-custom-trainer"
@@ -85,36 +89,23 @@ TRAIN_JOB_WITH_CUSTOM_TRAINER = "train-job-with-custom-trainer"
 
 
 @pytest.fixture
-def kubernetes_backend(request):
+def kubernetes_backend(kubernetes_apis):
     """Provide a KubernetesBackend with mocked Kubernetes APIs."""
-    with (
-        patch("kubernetes.config.load_kube_config", return_value=None),
-        patch(
-            "kubernetes.client.CustomObjectsApi",
-            return_value=Mock(
-                create_namespaced_custom_object=Mock(side_effect=conditional_error_handler),
-                patch_namespaced_custom_object=Mock(side_effect=conditional_error_handler),
-                delete_namespaced_custom_object=Mock(side_effect=conditional_error_handler),
-                get_namespaced_custom_object=Mock(
-                    side_effect=get_namespaced_custom_object_response
-                ),
-                get_cluster_custom_object=Mock(side_effect=get_cluster_custom_object_response),
-                list_namespaced_custom_object=Mock(
-                    side_effect=list_namespaced_custom_object_response
-                ),
-                list_cluster_custom_object=Mock(side_effect=list_cluster_custom_object),
-            ),
-        ),
-        patch(
-            "kubernetes.client.CoreV1Api",
-            return_value=Mock(
-                list_namespaced_pod=Mock(side_effect=list_namespaced_pod_response),
-                read_namespaced_pod_log=Mock(side_effect=mock_read_namespaced_pod_log),
-                list_namespaced_event=Mock(side_effect=mock_list_namespaced_event),
-            ),
-        ),
-    ):
-        yield KubernetesBackend(KubernetesBackendConfig())
+    custom_api = kubernetes_apis.custom_api
+    custom_api.create_namespaced_custom_object.side_effect = conditional_error_handler
+    custom_api.patch_namespaced_custom_object.side_effect = conditional_error_handler
+    custom_api.delete_namespaced_custom_object.side_effect = conditional_error_handler
+    custom_api.get_namespaced_custom_object.side_effect = get_namespaced_custom_object_response
+    custom_api.get_cluster_custom_object.side_effect = get_cluster_custom_object_response
+    custom_api.list_namespaced_custom_object.side_effect = list_namespaced_custom_object_response
+    custom_api.list_cluster_custom_object.side_effect = list_cluster_custom_object
+
+    core_api = kubernetes_apis.core_api
+    core_api.list_namespaced_pod.side_effect = list_namespaced_pod_response
+    core_api.read_namespaced_pod_log.side_effect = mock_read_namespaced_pod_log
+    core_api.list_namespaced_event.side_effect = mock_list_namespaced_event
+
+    return KubernetesBackend(KubernetesBackendConfig())
 
 
 # --------------------------
@@ -128,22 +119,43 @@ def conditional_error_handler(*args, **kwargs):
         raise multiprocessing.TimeoutError()
     elif args[2] == RUNTIME:
         raise RuntimeError()
+    return Mock()
 
 
 def list_namespaced_pod_response(*args, **kwargs):
     """Return a mock pod list response for the requested TrainJob."""
     label_selector = kwargs.get("label_selector", "")
-    pod_list = (
-        get_mock_pod_list_with_restarts()
-        if JOB_WITH_POD_RESTARTS in label_selector
-        else get_mock_pod_list()
-    )
+    if label_selector == constants.TRAINJOB_PODS_LABEL_SELECTOR:
+        # Pods of all TrainJobs which are returned by the list_namespaced_custom_object mock.
+        pod_list = models.IoK8sApiCoreV1PodList(
+            items=[
+                *get_mock_pod_list("basic-job-1").items,
+                *get_mock_pod_list("basic-job-2").items,
+            ]
+        )
+    elif JOB_WITH_POD_RESTARTS in label_selector:
+        pod_list = get_mock_pod_list_with_restarts()
+    elif MPI_TRAIN_JOB_NAME in label_selector:
+        pod_list = get_mock_mpi_pod_list()
+    else:
+        pod_list = get_mock_pod_list()
+
+    # Filter the Pods by the step requirements of the label selector. The JobSet name is not
+    # checked, since the mocked Pods are shared across TrainJobs.
+    for requirement in label_selector.split(","):
+        key, sep, value = requirement.partition("=")
+        if sep and key != constants.JOBSET_NAME_LABEL:
+            pod_list.items = [pod for pod in pod_list.items if pod.metadata.labels[key] == value]
+
     mock_thread = Mock()
-    mock_thread.get.return_value = pod_list
+    # The Pods are listed without preloading content, so return the raw JSON response.
+    mock_thread.get.return_value = Mock(
+        data=json.dumps(pod_list.to_dict(), default=datetime.datetime.isoformat)
+    )
     return mock_thread
 
 
-def get_mock_pod_list():
+def get_mock_pod_list(train_job_name: str = BASIC_TRAIN_JOB_NAME):
     """Create a mocked Kubernetes PodList object with pods for different training steps."""
     return models.IoK8sApiCoreV1PodList(
         items=[
@@ -153,7 +165,7 @@ def get_mock_pod_list():
                     name="dataset-initializer-pod",
                     namespace=DEFAULT_NAMESPACE,
                     labels={
-                        constants.JOBSET_NAME_LABEL: BASIC_TRAIN_JOB_NAME,
+                        constants.JOBSET_NAME_LABEL: train_job_name,
                         constants.JOBSET_RJOB_NAME_LABEL: constants.DATASET_INITIALIZER,
                         constants.JOB_INDEX_LABEL: "0",
                     },
@@ -175,7 +187,7 @@ def get_mock_pod_list():
                     name="model-initializer-pod",
                     namespace=DEFAULT_NAMESPACE,
                     labels={
-                        constants.JOBSET_NAME_LABEL: BASIC_TRAIN_JOB_NAME,
+                        constants.JOBSET_NAME_LABEL: train_job_name,
                         constants.JOBSET_RJOB_NAME_LABEL: constants.MODEL_INITIALIZER,
                         constants.JOB_INDEX_LABEL: "0",
                     },
@@ -197,7 +209,7 @@ def get_mock_pod_list():
                     name="node-0-pod",
                     namespace=DEFAULT_NAMESPACE,
                     labels={
-                        constants.JOBSET_NAME_LABEL: BASIC_TRAIN_JOB_NAME,
+                        constants.JOBSET_NAME_LABEL: train_job_name,
                         constants.JOBSET_RJOB_NAME_LABEL: constants.NODE,
                         constants.JOB_INDEX_LABEL: "0",
                     },
@@ -218,6 +230,23 @@ def get_mock_pod_list():
     )
 
 
+def get_mock_mpi_pod_list() -> models.IoK8sApiCoreV1PodList:
+    """Create Pods of the MPI TrainJob with the launcher and two worker nodes."""
+    pods = []
+    for pod_name, rjob_name, job_index in [
+        ("launcher-pod", constants.LAUNCHER, "0"),
+        ("worker-0-pod", constants.NODE, "0"),
+        ("worker-1-pod", constants.NODE, "1"),
+    ]:
+        pod = get_mock_pod_list(MPI_TRAIN_JOB_NAME).items[-1]
+        pod.metadata.name = pod_name
+        pod.metadata.labels[constants.JOBSET_RJOB_NAME_LABEL] = rjob_name
+        pod.metadata.labels[constants.JOB_INDEX_LABEL] = job_index
+        pods.append(pod)
+
+    return models.IoK8sApiCoreV1PodList(items=pods)
+
+
 def get_mock_pod_list_with_restarts() -> models.IoK8sApiCoreV1PodList:
     """Create Pods where newer replacements share the same TrainJob component roles."""
     old_timestamp = datetime.datetime(2025, 6, 1, 10, 0, 0)
@@ -420,7 +449,12 @@ def get_namespaced_custom_object_response(*args, **kwargs):
     if args[4] == FORBIDDEN:
         raise client.ApiException(status=403)
     if args[3] == TRAIN_JOBS:  # TODO: review this.
-        mock_thread.get.return_value = add_status(create_train_job(train_job_name=args[4]))
+        mock_thread.get.return_value = add_status(
+            create_train_job(train_job_name=args[4]),
+            condition_type=(
+                constants.TRAINJOB_FAILED if args[4] == FAILED_JOB else constants.TRAINJOB_COMPLETE
+            ),
+        )
     elif args[3] == constants.TRAINING_RUNTIME_PLURAL:
         # Return a namespaced TrainingRuntime for the requested name.
         mock_thread.get.return_value = normalize_model(
@@ -433,6 +467,7 @@ def get_namespaced_custom_object_response(*args, **kwargs):
 
 def add_status(
     train_job: models.TrainerV1alpha1TrainJob,
+    condition_type: str = constants.TRAINJOB_COMPLETE,
 ) -> models.TrainerV1alpha1TrainJob:
     """
     Add status information to the train job.
@@ -441,7 +476,7 @@ def add_status(
     status = models.TrainerV1alpha1TrainJobStatus(
         conditions=[
             models.IoK8sApimachineryPkgApisMetaV1Condition(
-                type="Complete",
+                type=condition_type,
                 status="True",
                 lastTransitionTime=datetime.datetime.now(),
                 reason="JobCompleted",
@@ -987,6 +1022,31 @@ def test_get_runtime(kubernetes_backend, test_case):
     print("test execution complete")
 
 
+def test_get_runtime_cache(kubernetes_backend):
+    """Test KubernetesBackend.get_runtime caches runtimes until they are invalidated."""
+    get_namespaced_custom_object = kubernetes_backend.custom_api.get_namespaced_custom_object
+
+    runtime = kubernetes_backend.get_runtime(TORCH_RUNTIME)
+    assert kubernetes_backend.get_runtime(TORCH_RUNTIME) is runtime
+    assert get_namespaced_custom_object.call_count == 1
+
+    kubernetes_backend.invalidate_runtime_cache(TORCH_RUNTIME)
+    assert asdict(kubernetes_backend.get_runtime(TORCH_RUNTIME)) == asdict(runtime)
+    assert get_namespaced_custom_object.call_count == 2
+    # The namespaced TrainingRuntime exists, so cluster scope is never queried.
+    kubernetes_backend.custom_api.get_cluster_custom_object.assert_not_called()
+
+
+def test_get_runtime_cluster_fallback(kubernetes_backend):
+    """Test KubernetesBackend.get_runtime queries cluster scope only on a namespaced 404."""
+    kubernetes_backend.get_runtime(NOT_FOUND)
+    assert kubernetes_backend.custom_api.get_cluster_custom_object.call_count == 1
+
+    with pytest.raises(RuntimeError):
+        kubernetes_backend.get_runtime(FORBIDDEN)
+    assert kubernetes_backend.custom_api.get_cluster_custom_object.call_count == 1
+
+
 @pytest.mark.parametrize(
     "test_case",
     [
@@ -1526,6 +1586,8 @@ def test_train(kubernetes_backend, test_case):
             DEFAULT_NAMESPACE,
             constants.TRAINJOB_PLURAL,
             expected_output.to_dict(),
+            _preload_content=False,
+            _request_timeout=common_constants.DEFAULT_REQUEST_TIMEOUT,
         )
 
     except Exception as e:
@@ -1533,6 +1595,38 @@ def test_train(kubernetes_backend, test_case):
     print("test execution complete")
 
 
+def test_train_many(kubernetes_backend):
+    """Test KubernetesBackend.train_many sends all create requests before waiting for them."""
+    print("Executing test: train many TrainJobs with a failed TrainJob")
+    create_thread = Mock()
+    create_thread.get.side_effect = [Mock(), multiprocessing.TimeoutError()]
+    kubernetes_backend.custom_api.create_namespaced_custom_object.side_effect = None
+    kubernetes_backend.custom_api.create_namespaced_custom_object.return_value = create_thread
+
+    results = kubernetes_backend.train_many(
+        [
+            {"runtime": TORCH_RUNTIME},
+            {
+                "runtime": TORCH_TUNE_RUNTIME,
+                "trainer": types.CustomTrainer(func=lambda: print("Hello World")),
+            },
+            {"runtime": TORCH_RUNTIME},
+        ]
+    )
+
+    assert isinstance(results[0], str)
+    assert isinstance(results[1], ValueError)
+    assert isinstance(results[2], TimeoutError)
+    assert "may still be created" in str(results[2])
+    assert kubernetes_backend.custom_api.create_namespaced_custom_object.call_count == 2
+    for call in kubernetes_backend.custom_api.create_namespaced_custom_object.call_args_list:
+        assert call.kwargs == {
+            "async_req": True,
+            "_request_timeout": common_constants.DEFAULT_REQUEST_TIMEOUT,
+        }
+    print("test execution complete")
+
+
 @pytest.mark.parametrize(
     "test_case",
     [
@@ -1631,6 +1725,15 @@ def test_list_jobs(kubernetes_backend, test_case):
     print("test execution complete")
 
 
+def test_list_jobs_batches_requests(kubernetes_backend):
+    """Test KubernetesBackend.list_jobs lists Pods and fetches a shared runtime only once."""
+    jobs = kubernetes_backend.list_jobs()
+
+    assert len(jobs) == 2
+    assert kubernetes_backend.custom_api.get_namespaced_custom_object.call_count == 1
+    assert kubernetes_backend.core_api.list_namespaced_pod.call_count == 1
+
+
 @pytest.mark.parametrize(
     "test_case",
     [
@@ -1640,6 +1743,53 @@ def test_list_jobs(kubernetes_backend, test_case):
             config={"name": BASIC_TRAIN_JOB_NAME},
             expected_output=["test log content"],
         ),
+        TestCase(
+            name="valid flow with initializer step",
+            expected_status=SUCCESS,
+            config={"name": BASIC_TRAIN_JOB_NAME, "step": constants.DATASET_INITIALIZER},
+            expected_output=["test log content"],
+        ),
+        TestCase(
+            name="no logs for pending step",
+            expected_status=SUCCESS,
+            config={"name": JOB_WITH_POD_RESTARTS},
+            expected_output=[],
+        ),
+        TestCase(
+            name="no logs for missing step",
+            expected_status=SUCCESS,
+            config={"name": BASIC_TRAIN_JOB_NAME, "step": constants.NODE + "-1"},
+            expected_output=[],
+        ),
+        TestCase(
+            name="MPI launcher logs for the first node step",
+            expected_status=SUCCESS,
+            config={"name": MPI_TRAIN_JOB_NAME, "mpi": True, "pod_name": "launcher-pod"},
+            expected_output=["test log content"],
+        ),
+        TestCase(
+            name="MPI worker logs for the next node steps",
+            expected_status=SUCCESS,
+            config={
+                "name": MPI_TRAIN_JOB_NAME,
+                "mpi": True,
+                "step": constants.NODE + "-2",
+                "pod_name": "worker-1-pod",
+            },
+            expected_output=["test log content"],
+        ),
+        TestCase(
+            name="no logs when the node index can't be resolved",
+            expected_status=SUCCESS,
+            config={"name": BASIC_TRAIN_JOB_NAME, "no_spec": True},
+            expected_output=[],
+        ),
+        TestCase(
+            name="runtime error when TrainJob doesn't exist",
+            expected_status=FAILED,
+            config={"name": NOT_FOUND},
+            expected_error=RuntimeError,
+        ),
         TestCase(
             name="runtime error when getting logs",
             expected_status=FAILED,
@@ -1653,11 +1803,31 @@ def test_get_job_logs(kubernetes_backend, test_case):
     print("Executing test:", test_case.name)
     try:
         kubernetes_backend.namespace = test_case.config.get("namespace", DEFAULT_NAMESPACE)
-        logs = kubernetes_backend.get_job_logs(test_case.config.get("name"))
+        if test_case.config.get("mpi"):
+            runtime = create_runtime_type(name=TORCH_RUNTIME)
+            runtime.trainer.set_command(constants.MPI_COMMAND)
+            kubernetes_backend.get_runtime = lambda name: runtime
+        if test_case.config.get("no_spec"):
+            train_job = create_train_job(train_job_name=test_case.config["name"])
+            train_job.spec = None
+            kubernetes_backend.custom_api.get_namespaced_custom_object.side_effect = None
+            kubernetes_backend.custom_api.get_namespaced_custom_object.return_value = Mock(
+                get=Mock(return_value=train_job)
+            )
+
+        logs = kubernetes_backend.get_job_logs(
+            test_case.config.get("name"),
+            step=test_case.config.get("step", constants.NODE + "-0"),
+        )
         # Convert iterator to list for comparison.
         logs_list = list(logs)
         assert test_case.expected_status == SUCCESS
         assert logs_list == test_case.expected_output
+        if "pod_name" in test_case.config:
+            read_log_call = kubernetes_backend.core_api.read_namespaced_pod_log.call_args
+            assert read_log_call.kwargs["name"] == test_case.config["pod_name"]
+        if test_case.config.get("no_spec"):
+            kubernetes_backend.core_api.list_namespaced_pod.assert_not_called()
     except Exception as e:
         assert type(e) is test_case.expected_error
     print("test execution complete")
@@ -1710,7 +1880,7 @@ def test_get_job_logs(kubernetes_backend, test_case):
             name="job failed when not expected",
             expected_status=FAILED,
             config={
-                "name": "failed-job",
+                "name": FAILED_JOB,
                 "status": {constants.TRAINJOB_RUNNING},
             },
             expected_error=RuntimeError,
@@ -1750,17 +1920,6 @@ def test_wait_for_job_status(kubernetes_backend, test_case):
     """Test KubernetesBackend.wait_for_job_status with various scenarios."""
     print("Executing test:", test_case.name)
 
-    original_get_job = kubernetes_backend.get_job
-
-    # TrainJob has unexpected failed status.
-    def mock_get_job(name):
-        job = original_get_job(name)
-        if test_case.config.get("name") == "failed-job":
-            job.status = constants.TRAINJOB_FAILED
-        return job
-
-    kubernetes_backend.get_job = mock_get_job
-
     try:
         job = kubernetes_backend.wait_for_job_status(**test_case.config)
 
@@ -1775,6 +1934,32 @@ def test_wait_for_job_status(kubernetes_backend, test_case):
     print("test execution complete")
 
 
+def test_wait_for_job_status_checks_pods_once_finished(kubernetes_backend):
+    """Test KubernetesBackend.wait_for_job_status lists Pods only after the TrainJob finishes."""
+    running_job = Mock()
+    running_job.get.return_value = create_train_job(train_job_name=BASIC_TRAIN_JOB_NAME)
+    running_job_responses = iter([running_job, running_job])
+
+    # The TrainJob is returned without conditions twice before it is complete.
+    def get_namespaced_custom_object(*args, **kwargs):
+        if args[3] == TRAIN_JOBS:
+            return next(running_job_responses, None) or get_namespaced_custom_object_response(
+                *args, **kwargs
+            )
+        return get_namespaced_custom_object_response(*args, **kwargs)
+
+    kubernetes_backend.custom_api.get_namespaced_custom_object.side_effect = (
+        get_namespaced_custom_object
+    )
+
+    job = kubernetes_backend.wait_for_job_status(
+        BASIC_TRAIN_JOB_NAME, timeout=1, polling_interval=0.01
+    )
+
+    assert job.status == constants.TRAINJOB_COMPLETE
+    assert kubernetes_backend.core_api.list_namespaced_pod.call_count == 1
+
+
 @pytest.mark.parametrize(
     "test_case",
     [
@@ -160,6 +160,41 @@ def get_runtime_trainer(
     return trainer
 
 
+def get_pod_label_selector(trainjob_name: str) -> str:
+    """
+    Get the label selector for Pods created by the given TrainJob.
+    """
+    return constants.POD_LABEL_SELECTOR_PREFIX + trainjob_name + constants.POD_LABEL_SELECTOR_SUFFIX
+
+
+def get_pod_creation_timestamp(pod: dict[str, Any]) -> str:
+    """
+    Get the creation timestamp of the raw Pod to sort Pods by their creation time.
+    Pods without the timestamp are sorted first.
+    """
+    return (pod.get("metadata") or {}).get("creationTimestamp") or ""
+
+
+def get_pod_step_fields(
+    pod: dict[str, Any],
+) -> tuple[models.IoK8sApiCoreV1PodSpec, models.IoK8sApiCoreV1PodStatus | None]:
+    """
+    Get the Pod spec and status from the raw Pod. Only the fields required for the TrainJob
+    step are deserialized, e.g. the containers and the Pod phase.
+    """
+    pod_spec = models.IoK8sApiCoreV1PodSpec(
+        containers=[
+            models.IoK8sApiCoreV1Container.from_dict(container)
+            for container in pod["spec"].get("containers") or []
+        ]
+    )
+    pod_status = None
+    if pod.get("status"):
+        pod_status = models.IoK8sApiCoreV1PodStatus(phase=pod["status"].get("phase"))
+
+    return pod_spec, pod_status
+
+
 def get_trainjob_initializer_step(
     pod_name: str,
     pod_spec: models.IoK8sApiCoreV1PodSpec,
@@ -384,8 +419,9 @@ def get_command_using_train_func(
     is_mpi = runtime.trainer.command[0] == "mpirun"
     # The default file location for OpenMPI is: /home/mpiuser/<FILE_NAME>.py
     if is_mpi:
-        func_file = os.path.join(constants.DEFAULT_MPI_USER_HOME, func_file)
-        install_log_file = os.path.join(constants.DEFAULT_MPI_USER_HOME, "pip_install.log")
+        mpi_user_home = constants.get_default_mpi_user_home()
+        func_file = os.path.join(mpi_user_home, func_file)
+        install_log_file = os.path.join(mpi_user_home, "pip_install.log")
     else:
         install_log_file = "pip_install.log"
 
@@ -14,12 +14,10 @@
 from collections.abc import Callable, Iterator
 from datetime import datetime
 import logging
-import random
-import string
 import tempfile
 import time
-import uuid
 
+import kubeflow.common.utils as common_utils
 from kubeflow.trainer.backends.base import RuntimeBackend
 from kubeflow.trainer.backends.localprocess import utils as local_utils
 from kubeflow.trainer.backends.localprocess.constants import local_runtimes
@@ -94,10 +92,7 @@ class LocalProcessBackend(RuntimeBackend):
             name = metadata_section.get("name")
 
         # Generate train job name if not provided via options
-        trainjob_name = name or (
-            random.choice(string.ascii_lowercase)
-            + uuid.uuid4().hex[: constants.JOB_NAME_UUID_LENGTH]
-        )
+        trainjob_name = name or common_utils.generate_job_name()
 
         # localprocess backend only supports CustomTrainer
         if not isinstance(trainer, types.CustomTrainer):
@@ -215,11 +210,14 @@ class LocalProcessBackend(RuntimeBackend):
     def wait_for_job_status(
         self,
         name: str,
-        status: set[str] = {constants.TRAINJOB_COMPLETE},
+        status: set[str] | None = None,
         timeout: int = 600,
         polling_interval: int = 2,
         callbacks: list[Callable[[types.TrainJob], None]] | None = None,
     ) -> types.TrainJob:
+        if status is None:
+            status = {constants.TRAINJOB_COMPLETE}
+
         if polling_interval <= 0:
             raise ValueError(
                 f"Polling interval must be a positive number, got polling_interval={polling_interval}"
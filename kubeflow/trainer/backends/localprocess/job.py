@@ -45,7 +45,9 @@ class LocalJob(threading.Thread):
         super().__init__()
         self.name = name
         self.command = command
-        self._stdout = ""
+        # Output chunks are appended to a list and joined on read, since concatenating to
+        # the attribute copies the whole output for every line.
+        self._stdout: list[str] = []
         self._returncode = None
         self._success = False
         self._status = constants.TRAINJOB_CREATED
@@ -64,7 +66,7 @@ class LocalJob(threading.Thread):
             dep.join()
             if not dep.success:
                 with self._lock:
-                    self._stdout = f"Dependency {dep.name} failed. Skipping"
+                    self._stdout = [f"Dependency {dep.name} failed. Skipping"]
                 return
 
         current_dir = os.getcwd()
@@ -91,7 +93,7 @@ class LocalJob(threading.Thread):
             while True:
                 if self._cancel_requested.is_set():
                     self._process.terminate()
-                    self._stdout += "[JobCancelled]\n"
+                    self._stdout.append("[JobCancelled]\n")
                     self._status = constants.TRAINJOB_FAILED
                     self._success = False
                     return
@@ -100,7 +102,7 @@ class LocalJob(threading.Thread):
                 output_line = self._process.stdout.readline()
                 with self._lock:
                     if output_line:
-                        self._stdout += output_line
+                        self._stdout.append(output_line)
                         self._output_updated.set()
 
                 if not output_line and self._process.poll() is not None:
@@ -118,12 +120,13 @@ class LocalJob(threading.Thread):
             self._status = (
                 constants.TRAINJOB_COMPLETE if self._success else (constants.TRAINJOB_FAILED)
             )
-            self._stdout += msg
-            logger.debug("Job output: ", self._stdout)
+            self._stdout.append(msg)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Job output: %s", self.stdout)
 
         except Exception as e:
             with self._lock:
-                self._stdout += f"Exception: {e}\n"
+                self._stdout.append(f"Exception: {e}\n")
                 self._success = False
                 self._status = constants.TRAINJOB_FAILED
         finally:
@@ -132,7 +135,7 @@ class LocalJob(threading.Thread):
     @property
     def stdout(self):
         with self._lock:
-            return self._stdout
+            return "".join(self._stdout)
 
     @property
     def success(self):
@@ -151,7 +154,7 @@ class LocalJob(threading.Thread):
 
     def logs(self, follow=False) -> list[str]:
         if not follow:
-            return self._stdout.splitlines()
+            return self.stdout.splitlines()
 
         try:
             for chunk in self.stream_logs():
@@ -159,7 +162,7 @@ class LocalJob(threading.Thread):
         except StopIteration:
             pass
 
-        return self._stdout.splitlines()
+        return self.stdout.splitlines()
 
     def stream_logs(self):
         """Generator that yields new output lines as they come in."""
@@ -167,9 +170,8 @@ class LocalJob(threading.Thread):
         while self.is_alive() or last_index < len(self._stdout):
             self._output_updated.wait(timeout=1)
             with self._lock:
-                data = self._stdout
-                new_data = data[last_index:]
-                last_index = len(data)
+                new_data = "".join(self._stdout[last_index:])
+                last_index = len(self._stdout)
                 self._output_updated.clear()
             if new_data:
                 yield new_data
@@ -273,7 +273,7 @@ def get_local_train_job_script(
             pip_index_urls=(
                 trainer.pip_index_urls
                 if trainer.pip_index_urls
-                else constants.DEFAULT_PIP_INDEX_URLS
+                else constants.get_default_pip_index_urls()
             ),
             runtime_packages=runtime_trainer.packages,
             trainer_packages=trainer.packages_to_install,
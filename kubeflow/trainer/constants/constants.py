@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import os
+import sys
 import textwrap
 
 # Common constants.
@@ -46,23 +48,33 @@ TRAINJOB_COMPLETE = "Complete"
 # The failed status of the TrainJob, defined when TrainJob CR has failed condition.
 TRAINJOB_FAILED = "Failed"
 
+# All statuses of the TrainJob.
+JOB_STATUSES = frozenset({TRAINJOB_CREATED, TRAINJOB_RUNNING, TRAINJOB_COMPLETE, TRAINJOB_FAILED})
+
+# The statuses of the finished TrainJob, defined by the TrainJob CR conditions.
+JOB_TERMINAL_STATUSES = frozenset({TRAINJOB_COMPLETE, TRAINJOB_FAILED})
+
 # The succeeded phase of the Pods.
 POD_SUCCEEDED = "Succeeded"
 
+# The label keys and the rJob names below are interned, since they are used as keys to look
+# up the labels of every TrainJob Pod. Identifier-like constants, e.g. "node" or the TrainJob
+# statuses, are already interned by Python.
+
 # The label key to identify the relationship between TrainJob and Pod template in the runtime.
 # For example, what PodTemplate must be overridden by TrainJob's .spec.trainer APIs.
-TRAINJOB_ANCESTOR_LABEL = "trainer.kubeflow.org/trainjob-ancestor-step"
+TRAINJOB_ANCESTOR_LABEL = sys.intern("trainer.kubeflow.org/trainjob-ancestor-step")
 
 # The label key to identify ML framework that runtime uses (e.g. torch, deepspeed, torchtune, etc.)
 RUNTIME_FRAMEWORK_LABEL = "trainer.kubeflow.org/framework"
 
 # The name of the ReplicatedJob and container of the dataset initializer.
 # Also, it represents the `trainjob-ancestor-step` label value for the dataset initializer step.
-DATASET_INITIALIZER = "dataset-initializer"
+DATASET_INITIALIZER = sys.intern("dataset-initializer")
 
 # The name of the ReplicatedJob and container of the model initializer.
 # Also, it represents the `trainjob-ancestor-step` label value for the model initializer step.
-MODEL_INITIALIZER = "model-initializer"
+MODEL_INITIALIZER = sys.intern("model-initializer")
 
 # The env name for the access token of dataset/model initializer.
 INITIALIZER_ENV_ACCESS_TOKEN = "ACCESS_TOKEN"
@@ -75,10 +87,10 @@ INITIALIZER_DEFAULT_IGNORE_PATTERNS = ["*.msgpack", "*.h5", "*.bin", "*.pt", "*.
 WORKSPACE_PATH = "/workspace"
 
 # The path where initializer downloads dataset.
-DATASET_PATH = os.path.join(WORKSPACE_PATH, "dataset")
+DATASET_PATH = f"{WORKSPACE_PATH}/dataset"
 
 # The path where initializer downloads model.
-MODEL_PATH = os.path.join(WORKSPACE_PATH, "model")
+MODEL_PATH = f"{WORKSPACE_PATH}/model"
 
 # The name of the ReplicatedJob to launch mpirun.
 LAUNCHER = "launcher"
@@ -106,28 +118,41 @@ TPU_LABEL = "google.com/tpu"
 NPU_LABEL = "huawei.com/Ascend910"
 
 # The label key to identify the JobSet name of the Pod.
-JOBSET_NAME_LABEL = "jobset.sigs.k8s.io/jobset-name"
+JOBSET_NAME_LABEL = sys.intern("jobset.sigs.k8s.io/jobset-name")
 
 # The label key to identify the JobSet's ReplicatedJob of the Pod.
-JOBSET_RJOB_NAME_LABEL = "jobset.sigs.k8s.io/replicatedjob-name"
+JOBSET_RJOB_NAME_LABEL = sys.intern("jobset.sigs.k8s.io/replicatedjob-name")
 
 # The label key to identify the Job completion index of the Pod.
-JOB_INDEX_LABEL = "batch.kubernetes.io/job-completion-index"
+JOB_INDEX_LABEL = sys.intern("batch.kubernetes.io/job-completion-index")
 
 # The Pod pending phase indicates that Pod has been accepted by the Kubernetes cluster,
 # but one or more of the containers has not been made ready to run.
 POD_PENDING = "Pending"
 
-# The label selector for Pods created by the TrainJob.
-# It checks the following rJob.name: dataset-initializer, model-initializer, launcher, node.
-POD_LABEL_SELECTOR = (
-    f"{JOBSET_NAME_LABEL}={{trainjob_name}},{JOBSET_RJOB_NAME_LABEL} "
-    f"in ({DATASET_INITIALIZER}, {MODEL_INITIALIZER}, {LAUNCHER}, {NODE})"
-)
+# The rJob names of the TrainJob steps. The initializers come first, followed by the launcher
+# and the nodes, which have a step per Job completion index.
+RJOB_NAMES = (DATASET_INITIALIZER, MODEL_INITIALIZER, LAUNCHER, NODE)
+
+# The rJob names which run the training nodes.
+NODE_RJOB_NAMES = frozenset({LAUNCHER, NODE})
+
+# The label selector for Pods created by the TrainJob is the prefix, the TrainJob name and
+# the suffix. It checks the rJob names of the TrainJob steps.
+POD_LABEL_SELECTOR_PREFIX = f"{JOBSET_NAME_LABEL}="
+POD_LABEL_SELECTOR_SUFFIX = f",{JOBSET_RJOB_NAME_LABEL} in ({', '.join(RJOB_NAMES)})"
+
+# The label selector for Pods created by any TrainJob, grouped by the JobSet name label.
+TRAINJOB_PODS_LABEL_SELECTOR = JOBSET_NAME_LABEL + POD_LABEL_SELECTOR_SUFFIX
+
 
 # Handle environment variable for multiple URLs (comma-separated).
 # The first URL will be the index-url, and remaining ones are extra-index-urls.
-DEFAULT_PIP_INDEX_URLS = os.getenv("DEFAULT_PIP_INDEX_URLS", "https://pypi.org/simple").split(",")
+# The environment is read on first use instead of at import.
+@functools.cache
+def get_default_pip_index_urls() -> list[str]:
+    return os.getenv("DEFAULT_PIP_INDEX_URLS", "https://pypi.org/simple").split(",")
+
 
 # The exec script to embed training function into container command.
 # __ENTRYPOINT__ depends on the MLPolicy, func_code and func_file is substituted in the `train` API.
@@ -147,8 +172,13 @@ DEFAULT_COMMAND = (
     EXEC_FUNC_SCRIPT.replace("__ENTRYPOINT__", "python"),
 )
 
+
 # The default home directory for the MPI user.
-DEFAULT_MPI_USER_HOME = os.getenv("DEFAULT_MPI_USER_HOME", "/home/mpiuser")
+# The environment is read on first use instead of at import.
+@functools.cache
+def get_default_mpi_user_home() -> str:
+    return os.getenv("DEFAULT_MPI_USER_HOME", "/home/mpiuser")
+
 
 # The default command for the OpenMPI CustomTrainer.
 MPI_COMMAND = (
@@ -181,6 +211,15 @@ DEFAULT_FRAMEWORK_IMAGES = {
     "torch": "pytorch/pytorch:2.7.1-cuda12.8-cudnn9-runtime",
 }
 
-# The length of the UUID suffix for auto-generated job names.
-# Total name length = 1 (random letter) + 11 (UUID hex) = 12 characters
-JOB_NAME_UUID_LENGTH = 11
+
+# The environment defaults are still available under their constant names.
+_ENV_DEFAULTS = {
+    "DEFAULT_PIP_INDEX_URLS": get_default_pip_index_urls,
+    "DEFAULT_MPI_USER_HOME": get_default_mpi_user_home,
+}
+
+
+def __getattr__(name: str):
+    if name in _ENV_DEFAULTS:
+        return _ENV_DEFAULTS[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -55,7 +55,7 @@ class CustomTrainer:
     image: str | None = None
     packages_to_install: list[str] | None = None
     pip_index_urls: list[str] = field(
-        default_factory=lambda: list(constants.DEFAULT_PIP_INDEX_URLS)
+        default_factory=lambda: list(constants.get_default_pip_index_urls())
     )
     num_nodes: int | None = None
     resources_per_node: dict | None = None
@@ -251,7 +251,7 @@ class TrainerType(Enum):
 
 
 # Representation for the Trainer of the runtime.
-@dataclass
+@dataclass(slots=True)
 class RuntimeTrainer:
     trainer_type: TrainerType
     framework: str
@@ -270,7 +270,7 @@ class RuntimeTrainer:
 
 
 # Representation for the Training Runtime.
-@dataclass
+@dataclass(slots=True)
 class Runtime:
     name: str
     trainer: RuntimeTrainer
@@ -279,7 +279,7 @@ class Runtime:
 
 
 # Representation for the TrainJob steps.
-@dataclass
+@dataclass(slots=True)
 class Step:
     name: str
     status: str | None
@@ -289,7 +289,7 @@ class Step:
 
 
 # Representation for the TrainJob.
-@dataclass
+@dataclass(slots=True)
 class TrainJob:
     name: str
     runtime: Runtime